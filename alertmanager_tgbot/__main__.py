@@ -1,18 +1,27 @@
 """Project entrypoint"""
 
 from sys import argv
-from asyncio import new_event_loop, sleep
+from asyncio import new_event_loop, sleep, gather
 from conf import (
     conf,
     init_conf,
     ConfValidationError,
     ConfFileNotFound
 )
-from api.api import get_server, set_bot
+from api.api import (
+    get_server,
+    set_bot,
+    set_alertmanager_worker,
+    set_alerts_queue,
+    consume_alerts_queue
+)
+from api.ingestion import AlertsQueue
 from tgbot import TGBot
 from alertmanager_workers import AlertmanagerWorker
 from grafana_workers import GrafanaWorker
 from project_logging import root_logger
+from request_senders import create_session
+from cache_storage import CacheStorage
 
 
 async def login(loop):
@@ -31,25 +40,56 @@ async def login(loop):
     await bot.start()
 
 
+def create_upstream_session():
+    """Create pooled http session for one upstream service"""
+    return create_session(
+        limit=conf.HTTP_POOL_LIMIT,
+        limit_per_host=conf.HTTP_POOL_LIMIT_PER_HOST,
+        dns_cache_ttl=conf.HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=conf.HTTP_KEEPALIVE_TIMEOUT
+    )
+
+
 async def run(loop):
     """Run"""
     root_logger.info("Starting alertmanager-tgbot")
     running = True
     while running:
+        sessions = []
+        tasks = []
+        cache_storage = None
         try:
             init_conf()
 
+            alertmanager_session = create_upstream_session()
+            grafana_session = create_upstream_session()
+            sessions = [alertmanager_session, grafana_session]
+
             grafna_worker = GrafanaWorker(
                 grafana_url=conf.GRAFANA_ADDRESS,
-                grafana_auth_token=conf.GRAFANA_AUTH_TOKEN
+                grafana_auth_token=conf.GRAFANA_AUTH_TOKEN,
+                session=grafana_session
             )
 
             alertmanager_worker = AlertmanagerWorker(
                 grafana_worker=grafna_worker,
                 alertmanager_address=conf.ALERTMANAGER_ADDRESS,
-                loop=loop
+                loop=loop,
+                session=alertmanager_session,
+                silences_enrichment=conf.SILENCES_ENRICHMENT,
+                full_sync_interval=conf.ALERTS_FULL_SYNC_INTERVAL,
+                min_delay=conf.POLL_MIN_INTERVAL,
+                max_delay=conf.POLL_MAX_INTERVAL,
+                delay_backoff=conf.POLL_BACKOFF,
+                alerts_query=conf.ALERTS_QUERY,
+                alerts_streaming=conf.ALERTS_STREAMING,
+                alertmanager_peers=conf.ALERTMANAGER_ADDRESSES,
+                peers_query_mode=conf.ALERTMANAGER_QUERY_MODE,
+                peers_request_timeout=conf.ALERTMANAGER_REQUEST_TIMEOUT,
+                silences_refresh_interval=conf.SILENCES_REFRESH_INTERVAL
             )
 
+            cache_storage = CacheStorage(conf.CACHE_PATH)
             bot = TGBot(
                 api_id=conf.API_ID,
                 api_hash=conf.API_HASH,
@@ -58,14 +98,22 @@ async def run(loop):
                 client_name=conf.CLIENT_NAME,
                 alertmanager_worker=alertmanager_worker,
                 grafana_worker=grafna_worker,
-                loop=loop
+                loop=loop,
+                cache_storage=cache_storage
             )
 
             set_bot(bot)
+            set_alertmanager_worker(alertmanager_worker)
+            set_alerts_queue(AlertsQueue(maxsize=conf.WEBHOOK_QUEUE_SIZE))
             alertmanager_worker.set_chanel_worker(bot)
 
-            loop.create_task(alertmanager_worker.sync_alerts())
-            loop.create_task(bot.start())
+            tasks.append(loop.create_task(alertmanager_worker.sync_alerts()))
+            tasks.append(loop.create_task(bot.start()))
+            tasks.append(loop.create_task(consume_alerts_queue()))
+            tasks.append(loop.create_task(
+                bot.audit_chanels_periodically(conf.CHANNEL_AUDIT_INTERVAL)
+            ))
+            tasks.append(loop.create_task(bot.expire_silences_on_time()))
             await get_server(bot.get_event_loop()).serve()
 
         except(
@@ -80,6 +128,16 @@ async def run(loop):
             running = False
             raise err
 
+        finally:
+            # Background workers must stop before their sessions are closed
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+            for session in sessions:
+                await session.close()
+            if cache_storage is not None:
+                cache_storage.close()
+
 
 if __name__ == "__main__":
     loop = new_event_loop()
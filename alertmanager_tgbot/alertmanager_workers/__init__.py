@@ -1,3 +1,3 @@
 """Modules with alertmanager workers"""
 
-from .alertmanager_workers import AlertmanagerWorker, AlertHasntSilence
+from .alertmanager_workers import AlertmanagerWorker, AlertHasntSilence, AllPeersFailed
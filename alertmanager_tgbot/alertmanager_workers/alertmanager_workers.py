@@ -1,22 +1,69 @@
 """Alertmanager Worker main class"""
 
 import asyncio
+from time import monotonic
 from textwrap import dedent
+from typing import List, AsyncIterator
+from aiohttp import ClientSession
+from pydantic import TypeAdapter
 
 from chanel_workers import ChanelWorkerInterface
-from data_models import ActiveAlerts, EnrichedActiveAlerts, EnrichedActiveAlert, Silence, Mute
-from request_senders import send_get_request, send_post_request, send_delete_request
+from chanel_workers.formatters import parse_date
+from data_models import (
+    ConfFileAlertsQuery,
+    ActiveAlert,
+    EnrichedActiveAlerts,
+    EnrichedActiveAlert,
+    AlertsDelta,
+    Silence,
+    Mute
+)
+from request_senders import (
+    send_get_request,
+    send_get_bytes_request,
+    send_get_stream_request,
+    send_post_request,
+    send_delete_request
+)
 from alertmanager_workers.logger import alertmanager_workers_logger
+from alertmanager_workers.silence_index import SilenceIndex
 from grafana_workers import GrafanaWorker
 
 
+# Validators for parsing alertmanager responses straight from bytes
+enriched_active_alerts_adapter = TypeAdapter(List[EnrichedActiveAlert])
+silences_adapter = TypeAdapter(List[Silence])
+
+# Alertmanager API paths relative to alertmanager address
+ALERTS_PATH = "api/v2/alerts"
+SILENCES_PATH = "api/v2/silences"
+SILENCE_PATH = "api/v2/silence"
+
+
 class AlertmanagerWorker():
     """
     Base class for working with alertmanager.
     args:
         chanel_worker: telegram chanel worker object
         alertmanager_address: address of alertmanager with http/https protocol
-        delay: sleep time in seconds for requests to alertmanager
+        alertmanager_peers: addresses of all alertmanager cluster instances,
+            only alertmanager_address is used if not provided
+        peers_query_mode: "first" to use first complete answer of peers
+            or "merge" to merge answers of all peers answered before deadline
+        peers_request_timeout: deadline in seconds for request to one peer
+        min_delay: min sleep time in seconds between requests to alertmanager,
+            used while alerts are changing
+        max_delay: max sleep time in seconds between requests to alertmanager,
+            sleep time grows up to it while alerts are not changing
+        delay_backoff: multiplier of sleep time after request without changes
+        alerts_query: filters applied by alertmanager to requested active alerts
+        session: pooled http session for requests to alertmanager
+        silences_enrichment: "bulk" to refresh all silences with one request
+            or "per_alert" to request every silence missing in index separately
+        silences_refresh_interval: time in seconds after which silences index
+            is refreshed from alertmanager
+        full_sync_interval: time in seconds between syncs of all alerts,
+            between them only changed alerts are synced
     """
     def __init__(
             self,
@@ -24,17 +71,57 @@ class AlertmanagerWorker():
             grafana_worker: GrafanaWorker,
             alertmanager_address: str,
             chanel_worker: ChanelWorkerInterface = None,
-            delay: int = 10
+            min_delay: float = 2,
+            max_delay: float = 30,
+            delay_backoff: float = 1.5,
+            alerts_query: ConfFileAlertsQuery = None,
+            session: ClientSession = None,
+            silences_enrichment: str = "bulk",
+            full_sync_interval: int = 300,
+            alerts_streaming: bool = False,
+            alertmanager_peers: list = None,
+            peers_query_mode: str = "first",
+            peers_request_timeout: float = 30,
+            silences_refresh_interval: float = 60
         ) -> None:
 
         self.grafana_worker = grafana_worker
         self.chanel_worker = chanel_worker
         self.alertmanager_address = alertmanager_address
-        self.alertmanager_alerts_address = self.alertmanager_address + "api/v2/alerts"
-        self.alertmanager_silences_address = self.alertmanager_address + "api/v2/silences"
-        self.alertmanager_silence_address = self.alertmanager_address + "api/v2/silence"
-        self.delay = delay
+        self.alertmanager_peers = alertmanager_peers or [alertmanager_address]
+        self.peers_query_mode = peers_query_mode
+        self.peers_request_timeout = peers_request_timeout
+
+        # Index of peer that answered last time, it is asked first on failover
+        self.healthy_peer = 0
+        self.min_delay = min_delay
+        self.max_delay = max(max_delay, min_delay)
+        self.delay_backoff = delay_backoff
+        self.delay = self.min_delay
+        self.sync_requested = asyncio.Event()
+        self.alerts_query = alerts_query or ConfFileAlertsQuery()
         self.loop = loop
+        self.session = session
+        self.silences_enrichment = silences_enrichment
+        self.silence_index = SilenceIndex(refresh_interval=silences_refresh_interval)
+
+        # Refresh of silences index in progress, concurrent refreshes wait for it
+        self.silences_refresh = None
+        self.full_sync_interval = full_sync_interval
+        self.alerts_streaming = alerts_streaming
+        self.last_full_sync = None
+
+        """
+        self.snapshot is dict with alerts from previous sync
+        structure is:
+        {
+            fingerprint: (signature, EnrichedActiveAlert),
+            ...
+        }
+        where:
+            signature: signature generated by 'get_alert_signature' method
+        """
+        self.snapshot = {}
 
 
     def set_chanel_worker(self, chanel_worker: ChanelWorkerInterface) -> None:
@@ -44,127 +131,608 @@ class AlertmanagerWorker():
         self.chanel_worker = chanel_worker
 
 
+    async def request_peer(self, request, peer: str):
+        """
+        Send request to alertmanager peer with deadline
+        args:
+            request: coroutine function that accepts peer address
+            peer: alertmanager address
+        """
+        try:
+            return await asyncio.wait_for(request(peer), timeout=self.peers_request_timeout)
+
+        except Exception as err:
+            alertmanager_workers_logger.warning(dedent("""\
+                                Request to alertmanager peer %s failed. Reason is - %s
+                                """), peer, str(err) or type(err).__name__)
+            raise
+
+
+    async def failover_peers(self, request):
+        """
+        Send request to alertmanager peers one by one until one of them answers.
+        Peer that answered last time is asked first
+        args:
+            request: coroutine function that accepts peer address
+        """
+        errors = []
+        peers_count = len(self.alertmanager_peers)
+        for shift in range(peers_count):
+            peer_index = (self.healthy_peer + shift) % peers_count
+            try:
+                response = await self.request_peer(request, self.alertmanager_peers[peer_index])
+            except Exception as err:
+                errors.append(err)
+                continue
+
+            self.healthy_peer = peer_index
+            return response
+
+        raise AllPeersFailed(errors)
+
+
+    async def query_peers(self, request) -> list:
+        """
+        Send request to all alertmanager peers concurrently.
+        Return list with first complete answer in "first" mode
+        or with answers of all peers answered before deadline in "merge" mode.
+        In "first" mode empty answer, e.g. of just restarted peer that
+        has not got cluster state yet, is returned only when other peers
+        don't answer with not empty one before deadline
+        args:
+            request: coroutine function that accepts peer address and returns list
+        """
+        if len(self.alertmanager_peers) == 1:
+            return [await self.request_peer(request, self.alertmanager_peers[0])]
+
+        pending = {
+            asyncio.ensure_future(self.request_peer(request, peer))
+            for peer in self.alertmanager_peers
+        }
+        responses = []
+        errors = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        errors.append(task.exception())
+                    else:
+                        responses.append(task.result())
+
+                if self.peers_query_mode == "first" \
+                    and any(len(response) > 0 for response in responses):
+                    break
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if not responses:
+            raise AllPeersFailed(errors)
+
+        if self.peers_query_mode == "first":
+            not_empty = [response for response in responses if len(response) > 0]
+            return [not_empty[0] if not_empty else responses[0]]
+
+        return responses
+
+
     async def create_silence(self, mute: Mute) -> str:
         """
-        Create silence in alertmanager
+        Create silence in alertmanager and add it to silences index
         args:
-            silence: silence that will be created
+            mute: silence that will be created
         """
-        response = await send_post_request(
-            url=self.alertmanager_silences_address,
-            message=mute.dict()
+        response = await self.failover_peers(
+            lambda peer: send_post_request(
+                url=peer + SILENCES_PATH,
+                message=mute.dict(),
+                session=self.session
+            )
         )
 
-        return response['silenceID']
+        silence_id = response['silenceID']
+
+        # Silence is indexed as alertmanager stores it, i.e. with dates in UTC.
+        # Silence is already created, so failed request of it is not error
+        # of command, silence gets into index with the next refresh
+        try:
+            self.silence_index.add(await self.get_silence(silence_id))
+
+        except Exception as err:
+            alertmanager_workers_logger.warning(dedent("""\
+                                Created silence %s was not added to silences index. Reason is - %s
+                                """), silence_id, str(err))
+
+        return silence_id
 
 
     async def delete_silence(self, silence_id: str) -> None:
         """
-        Delete silence by id
+        Delete silence by id and remove it from silences index
         args:
             silence: silence that will be created
         """
-        await send_delete_request(
-            url=self.alertmanager_silence_address+"/"+silence_id
+        await self.failover_peers(
+            lambda peer: send_delete_request(
+                url=peer + SILENCE_PATH + "/" + silence_id,
+                session=self.session
+            )
         )
+        self.silence_index.remove(silence_id)
 
 
-    async def unmute_alert(self, alert: EnrichedActiveAlert) -> None:
+    async def get_alert_silence_id(self, alert: EnrichedActiveAlert) -> str:
         """
-        Unmute specified alert
+        Get id of active silence that mutes specified alert.
+        Alert silences cached at send time may be outdated,
+        so silence is taken from silences index
         args:
-            silence: silence that will be created
+            alert: cached alert
         """
-        if len(alert.silences) == 0:
+        silences_ids = list(alert.status.silencedBy) + [
+            silence.id for silence in alert.silences
+                if silence.id not in alert.status.silencedBy
+        ]
+        if self.silence_index.is_stale():
+            await self.refresh_silences()
+
+        silences_ids = [
+            silence_id for silence_id in silences_ids
+                if self.silence_index.get(silence_id) is not None
+        ]
+        if len(silences_ids) == 0:
             raise AlertHasntSilence()
 
-        silence_id = alert.silences[0].id
+        return silences_ids[0]
+
+
+    async def unmute_alert(self, alert: EnrichedActiveAlert) -> str:
+        """
+        Unmute specified alert
+        args:
+            alert: cached alert
+        """
+        silence_id = await self.get_alert_silence_id(alert)
         await self.delete_silence(silence_id)
         return silence_id
 
 
-    def alerts_filter(self, alerts: ActiveAlerts) -> ActiveAlerts:
+    def get_alerts_query_params(self, filters: list = None) -> list:
+        """
+        Get query parameters for requesting active alerts,
+        so unnecessary alerts are filtered by alertmanager
+        args:
+            filters: additional alertmanager matchers for alerts labels
+        """
+        params = [
+            ("active", "true"),
+            ("silenced", str(self.alerts_query.silenced).lower()),
+            ("inhibited", str(self.alerts_query.inhibited).lower())
+        ]
+
+        if self.alerts_query.receiver:
+            params.append(("receiver", self.alerts_query.receiver))
+
+        for matcher in self.alerts_query.filter + (filters or []):
+            params.append(("filter", matcher))
+
+        return params
+
+
+    async def get_peer_alerts(self, peer: str, params: list) -> list:
+        """
+        Request necessary active alerts from one alertmanager peer.
+        In streaming mode alerts are parsed one by one while response is read,
+        otherwise response body is validated at once straight into alerts models
+        args:
+            peer: alertmanager address
+            params: query parameters for requesting active alerts
+        """
+        if self.alerts_streaming:
+            items = send_get_stream_request(
+                peer + ALERTS_PATH,
+                session=self.session,
+                params=params
+            )
+            alerts = []
+            async for item in items:
+                alert = EnrichedActiveAlert.model_validate_json(item)
+                if self.is_alert_necessary(alert):
+                    alerts.append(alert)
+            return alerts
+
+        alerts = await send_get_bytes_request(
+            peer + ALERTS_PATH,
+            session=self.session,
+            params=params
+        )
+        return [
+            alert for alert in enriched_active_alerts_adapter.validate_json(alerts)
+                if self.is_alert_necessary(alert)
+        ]
+
+
+    async def iter_active_alerts(self, filters: list = None) -> AsyncIterator[EnrichedActiveAlert]:
+        """
+        Request active alerts from alertmanager and yield necessary ones.
+        With single alertmanager in streaming mode alerts are yielded while response is read.
+        With several alertmanager peers their answers are requested concurrently
+        and merged answers are deduplicated by fingerprint, the latest updated alert is kept
+        args:
+            filters: additional alertmanager matchers for alerts labels
+        """
+        params = self.get_alerts_query_params(filters)
+        if len(self.alertmanager_peers) == 1 and self.alerts_streaming:
+            items = send_get_stream_request(
+                self.alertmanager_peers[0] + ALERTS_PATH,
+                session=self.session,
+                params=params
+            )
+            async for item in items:
+                alert = EnrichedActiveAlert.model_validate_json(item)
+                if self.is_alert_necessary(alert):
+                    yield alert
+            return
+
+        answers = await self.query_peers(
+            lambda peer: self.get_peer_alerts(peer, params)
+        )
+        if len(answers) == 1:
+            for alert in answers[0]:
+                yield alert
+            return
+
+        alerts = {}
+        for answer in answers:
+            for alert in answer:
+                previous = alerts.get(alert.fingerprint)
+                if previous is None or is_updated_later(alert.updatedAt, previous.updatedAt):
+                    alerts[alert.fingerprint] = alert
+
+        for alert in alerts.values():
+            yield alert
+
+
+    async def get_active_alerts(self, filters: list = None) -> EnrichedActiveAlerts:
+        """
+        Request necessary active alerts from alertmanager
+        args:
+            filters: additional alertmanager matchers for alerts labels
+        """
+        alerts = [alert async for alert in self.iter_active_alerts(filters)]
+        return EnrichedActiveAlerts(alerts=alerts)
+
+
+    def is_alert_necessary(self, alert: ActiveAlert) -> bool:
+        """
+        Check that alert must be sent to chats
+        args:
+            alert: active alert
+        """
+        if len(alert.status.inhibitedBy) != 0:
+            return False
+
+        if len(alert.receivers) == 0:
+            return False
+
+        if len(alert.receivers) == 1 and \
+            alert.receivers[0].get("name") == "blackhole":
+            return False
+
+        return True
+
+
+    def alerts_filter(self, alerts: EnrichedActiveAlerts) -> EnrichedActiveAlerts:
         """
         Filter alerts and remove unnecessary ones 
         args:
             alerts: active alerts list
         """
-        result = []
-        for alert in alerts.alerts:
-            if len(alert.status.inhibitedBy) != 0:
-                continue
+        result = [
+            alert for alert in alerts.alerts
+                if self.is_alert_necessary(alert)
+        ]
+        return EnrichedActiveAlerts(alerts=result)
 
-            if len(alert.receivers) == 0:
-                continue
 
-            if len(alert.receivers) == 1 and \
-                alert.receivers[0].get("name") == "blackhole":
-                continue
+    async def get_silence(self, silence_id: str) -> Silence:
+        """
+        Get single silence from alertmanager
+        args:
+            silence_id: id of requested silence
+        """
+        silence = await self.failover_peers(
+            lambda peer: send_get_request(
+                peer + SILENCE_PATH + "/" + silence_id,
+                session=self.session
+            )
+        )
+        return Silence(**silence)
+
+
+    async def get_silences(self) -> dict:
+        """
+        Get all silences from alertmanager with one request to every peer.
+        Result is dict with silence id as key and Silence as value
+        """
+        async def get_peer_silences(peer):
+            silences = await send_get_bytes_request(
+                peer + SILENCES_PATH,
+                session=self.session
+            )
+            return silences_adapter.validate_json(silences)
+
+        answers = await self.query_peers(get_peer_silences)
+        silences = {}
+        for answer in answers:
+            for silence in answer:
+                previous = silences.get(silence.id)
+                if previous is None or is_updated_later(silence.updatedAt, previous.updatedAt):
+                    silences[silence.id] = silence
 
-            result.append(alert)
+        return silences
 
-        result = {"alerts": result}
-        return ActiveAlerts(**result)
+
+    async def refresh_silences(self) -> None:
+        """
+        Replace silences index content with all silences from alertmanager.
+        Concurrent calls share one request to alertmanager
+        """
+        if self.silences_refresh is None or self.silences_refresh.done():
+            self.silences_refresh = asyncio.ensure_future(self._refresh_silences())
+
+        # Shielded, so cancelled caller doesn't cancel refresh for other ones
+        await asyncio.shield(self.silences_refresh)
+
+
+    async def _refresh_silences(self) -> None:
+        """
+        Request all silences and replace silences index content
+        """
+        self.silence_index.replace(await self.get_silences())
 
 
     async def enrich_alert(self, alert: EnrichedActiveAlert) -> EnrichedActiveAlert:
         """
-        Enrich specified alert
+        Enrich specified alert in place with silences from silences index.
+        Silences missing in index are requested separately and indexed
         args:
             alert: active alert
         """
-        if len(alert.status.silencedBy) > 0:
-            for silence_id in alert.status.silencedBy:
-                silence = await send_get_request(
-                    self.alertmanager_address \
-                    + "api/v2/silence/" \
-                    + silence_id
-                )
+        alert_silences = []
+        for silence_id in alert.status.silencedBy:
+            silence = self.silence_index.get(silence_id)
+            if silence is None:
+                silence = await self.get_silence(silence_id)
+                self.silence_index.add(silence)
 
-                silence = Silence(**silence)
-                alert.silences.append(silence)
+            alert_silences.append(silence)
 
+        alert.silences = alert_silences
         return alert
 
 
-    async def enrich_alerts(self, alerts: ActiveAlerts) -> EnrichedActiveAlerts:
+    async def enrich_alerts(self, alerts: EnrichedActiveAlerts) -> EnrichedActiveAlerts:
         """
-        Add silences information to existed active alerts
+        Add silences information to existed active alerts.
+        In bulk mode silences index is refreshed with one request
+        when it is stale or some silences are missing in it
         args:
             alerts: active alerts list
         """
+        silences_ids = [
+            silence_id
+            for alert in alerts.alerts
+                for silence_id in alert.status.silencedBy
+        ]
+        if self.silences_enrichment == "bulk" and len(silences_ids) > 0 \
+            and (self.silence_index.is_stale() or not self.silence_index.has_all(silences_ids)):
+            await self.refresh_silences()
+
         result = [
-            await self.enrich_alert(EnrichedActiveAlert(**alert.dict()))
+            await self.enrich_alert(alert)
             for alert in alerts.alerts
         ]
-        result = {"alerts": result}
-        return EnrichedActiveAlerts(**result)
+        return EnrichedActiveAlerts(alerts=result)
+
+
+    def get_alert_state(self, alert: ActiveAlert) -> tuple:
+        """
+        Get alert state that polling interval is adapted to
+        args:
+            alert: active alert
+        """
+        return (
+            alert.startsAt,
+            alert.status.state,
+            frozenset(alert.status.silencedBy)
+        )
+
+
+    def get_alert_signature(self, alert: ActiveAlert) -> tuple:
+        """
+        Get signature of alert content. Alert is changed when its signature changed.
+        updatedAt is not included, because it is bumped by every notification
+        that prometheus repeats for firing alert with the same content
+        args:
+            alert: active alert
+        """
+        return self.get_alert_state(alert) + (
+            tuple(sorted(alert.annotations.items())),
+        )
+
+
+    def is_state_changed(self, delta: AlertsDelta) -> bool:
+        """
+        Check that alerts were added, removed or their state was changed.
+        Alerts with changed annotations only don't speed up polling
+        args:
+            delta: difference between current and previous active alerts
+        """
+        if len(delta.added) > 0:
+            return True
+
+        changed = {alert.fingerprint: alert for alert in delta.changed}
+        for previous in delta.removed:
+            alert = changed.get(previous.fingerprint)
+            if alert is None \
+                or self.get_alert_state(alert) != self.get_alert_state(previous):
+                return True
+
+        return False
+
+
+    async def get_alerts_delta(self, alerts: AsyncIterator[EnrichedActiveAlert]) -> AlertsDelta:
+        """
+        Compare alerts with snapshot from previous sync and replace snapshot.
+        Alerts are consumed one by one and unchanged ones are dropped right away,
+        only added and changed alerts are kept and enriched
+        args:
+            alerts: active alerts iterator
+        """
+        snapshot = {}
+        alerts_to_enrich = []
+        removed = []
+        async for alert in alerts:
+            signature = self.get_alert_signature(alert)
+            previous = self.snapshot.get(alert.fingerprint)
+            if previous is not None and previous[0] == signature:
+                snapshot[alert.fingerprint] = previous
+                continue
+
+            alerts_to_enrich.append(alert)
+            if previous is not None:
+                removed.append(previous[1])
+
+        enriched_alerts = await self.enrich_alerts(EnrichedActiveAlerts(alerts=alerts_to_enrich))
+        added = []
+        changed = []
+        for alert in enriched_alerts.alerts:
+            if alert.fingerprint in self.snapshot:
+                changed.append(alert)
+            else:
+                added.append(alert)
+            snapshot[alert.fingerprint] = (self.get_alert_signature(alert), alert)
+
+        removed += [
+            previous[1]
+            for fingerprint, previous in self.snapshot.items()
+                if fingerprint not in snapshot
+        ]
+
+        self.snapshot = snapshot
+        return AlertsDelta(added=added, changed=changed, removed=removed)
+
+
+    def request_sync(self) -> None:
+        """
+        Wake up sync loop to request alerts right now instead of after delay
+        """
+        self.sync_requested.set()
+
+
+    async def wait_next_sync(self) -> None:
+        """
+        Sleep for current delay or until sync will be requested
+        """
+        try:
+            await asyncio.wait_for(self.sync_requested.wait(), timeout=self.delay)
+        except asyncio.TimeoutError:
+            pass
+        self.sync_requested.clear()
+
+
+    async def reconcile_alerts(self, labels: dict, chats_ids: list) -> None:
+        """
+        Sync in specified chats only alerts that have specified labels.
+        Alerts are filtered by alertmanager, so only related alerts are requested
+        args:
+            labels: labels that all synced alerts have
+            chats_ids: ids of chats where alerts will be synced
+        """
+        alerts = await self.get_active_alerts([
+            get_equal_matcher(name, value)
+            for name, value in labels.items()
+        ])
+        alerts = await self.enrich_alerts(alerts)
+        await self.chanel_worker.sync_alerts_scope(alerts, chats_ids, labels)
+
+
+    def adapt_delay(self, delta: AlertsDelta) -> None:
+        """
+        Shorten sleep time between requests while alerts state is changing
+        and back off up to max_delay while it is not
+        args:
+            delta: difference between current and previous active alerts
+        """
+        if self.is_state_changed(delta):
+            self.delay = self.min_delay
+        else:
+            self.delay = min(self.delay * self.delay_backoff, self.max_delay)
 
 
     async def sync_alerts(self) -> None:
         """
         Sync alerts in chats with alerts in alertmanager.
         This method use get-request to alertmanager, get all alerts
-        for a curent moment and send that to specified chanel worker. 
+        for a curent moment and send alerts changed since previous request
+        to specified chanel worker. All alerts are sent once in full_sync_interval
         """
         while True:
             try:
                 alertmanager_workers_logger.debug(dedent("""\
                                     Request active alerts from alertmanager and sync them in chats
                                     """))
-                alerts = await send_get_request(self.alertmanager_alerts_address)
-                alerts = {"alerts": alerts}
-                alerts = ActiveAlerts(**alerts)
-                alerts = self.alerts_filter(alerts)
-                alerts = await self.enrich_alerts(alerts)
-                await self.chanel_worker.sync_alerts(alerts)
-                await asyncio.sleep(self.delay)
+                delta = await self.get_alerts_delta(self.iter_active_alerts())
+
+                if self.last_full_sync is None \
+                    or monotonic() - self.last_full_sync >= self.full_sync_interval:
+                    alerts = EnrichedActiveAlerts(alerts=[
+                        alert for _, alert in self.snapshot.values()
+                    ])
+                    await self.chanel_worker.sync_alerts(alerts)
+                    self.last_full_sync = monotonic()
+
+                elif not delta.is_empty():
+                    await self.chanel_worker.sync_alerts_delta(delta)
+
+                else:
+                    alertmanager_workers_logger.debug("Alerts not changed, skip sync")
+
+                self.adapt_delay(delta)
 
             except Exception as err:
                 alertmanager_workers_logger.error(dedent("""\
                                     Sync alerts failed. Reason is - %s
                                     """), str(err))
-                continue
+                # Chats state is unknown, so all alerts will be synced next time
+                self.snapshot = {}
+                self.last_full_sync = None
+
+            await self.wait_next_sync()
+
+
+def get_equal_matcher(name: str, value: str) -> str:
+    """
+    Get alertmanager matcher string for label equal to value
+    args:
+        name: label name
+        value: label value
+    """
+    value = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'{name}="{value}"'
+
+
+def is_updated_later(updated_at: str, previous_updated_at: str) -> bool:
+    """
+    Check that object from one alertmanager peer is newer than its copy from another one
+    args:
+        updated_at: update date of object
+        previous_updated_at: update date of its copy
+    """
+    return parse_date(updated_at) > parse_date(previous_updated_at)
 
 
 # Module Exceptions
@@ -180,3 +748,19 @@ class AlertHasntSilence(Exception):
                 Alert does not have any silences
             """)
         )
+
+
+class AllPeersFailed(Exception):
+    """
+    Exception for cases when none of alertmanager peers answered
+    args:
+        errors: errors of requests to peers
+    """
+    def __init__(self, errors: list):
+        self.errors = errors
+        reasons = "; ".join(str(err) or type(err).__name__ for err in errors)
+        super().__init__(
+            dedent(f"""
+                All alertmanager peers failed. Reasons are - {reasons}
+            """)
+        )
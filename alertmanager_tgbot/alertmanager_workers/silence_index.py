@@ -0,0 +1,109 @@
+"""Local index of alertmanager silences"""
+
+from time import monotonic, time
+from typing import Optional
+
+from data_models import Silence
+from chanel_workers.formatters import get_timestamp
+
+
+class SilenceIndex():
+    """
+    Index of active silences by id.
+    Every silence expires at its endsAt, whole index is considered stale
+    after refresh interval and must be refreshed from alertmanager
+    args:
+        refresh_interval: time in seconds after which index is stale
+    """
+    def __init__(self, refresh_interval: float = 60) -> None:
+        self.refresh_interval = refresh_interval
+        self.refreshed_at = None
+
+        """
+        self.silences is dict with active silences
+        structure is:
+        {
+            silence_id: (expires_at, Silence),
+            ...
+        }
+        where:
+            expires_at: unix timestamp of silence endsAt
+        """
+        self.silences = {}
+
+
+    def is_stale(self) -> bool:
+        """
+        Check that index was never refreshed or refresh interval passed
+        """
+        return self.refreshed_at is None \
+            or monotonic() - self.refreshed_at >= self.refresh_interval
+
+
+    def replace(self, silences: dict) -> None:
+        """
+        Replace index content with all silences from alertmanager
+        args:
+            silences: silences indexed by id
+        """
+        self.silences = {}
+        for silence in silences.values():
+            self.add(silence)
+        self.refreshed_at = monotonic()
+
+
+    def add(self, silence: Silence) -> None:
+        """
+        Add or replace silence, expired silences are not indexed
+        args:
+            silence: alertmanager silence
+        """
+        if silence.status.get("state") == "expired":
+            self.silences.pop(silence.id, None)
+            return
+
+        expires_at = get_timestamp(silence.endsAt)
+        if expires_at <= time():
+            self.silences.pop(silence.id, None)
+            return
+
+        self.silences[silence.id] = (expires_at, silence)
+
+
+    def remove(self, silence_id: str) -> None:
+        """
+        Remove silence from index
+        args:
+            silence_id: silence id
+        """
+        self.silences.pop(silence_id, None)
+
+
+    def get(self, silence_id: str) -> Optional[Silence]:
+        """
+        Get active silence by id. None if silence is unknown or expired
+        args:
+            silence_id: silence id
+        """
+        entry = self.silences.get(silence_id)
+        if entry is None:
+            return None
+
+        expires_at, silence = entry
+        if expires_at <= time():
+            self.silences.pop(silence_id, None)
+            return None
+
+        return silence
+
+
+    def has_all(self, silences_ids: list) -> bool:
+        """
+        Check that all specified silences are active in index
+        args:
+            silences_ids: silences ids
+        """
+        return all(
+            self.get(silence_id) is not None
+            for silence_id in silences_ids
+        )
@@ -1,3 +1,10 @@
 """Modules with api behavior"""
 
-from .api import get_server, set_bot
+from .api import (
+    get_server,
+    set_bot,
+    set_alertmanager_worker,
+    set_alerts_queue,
+    consume_alerts_queue
+)
+from .ingestion import AlertsQueue, AlertsQueueFull
@@ -1,23 +1,30 @@
 """Module provides uvicorn server with FastAPI endpoints"""
 
 from uvicorn import Server, Config
-from fastapi import FastAPI, Response, BackgroundTasks, HTTPException
+from fastapi import FastAPI, Response
 from fastapi.responses import PlainTextResponse
 from fastapi_versioning import VersionedFastAPI, version
 
-from chanel_workers import SendAlertFailed, ChanelWorkerInterface
+from chanel_workers import ChanelWorkerInterface
 from data_models import Alerts
 from api.logger import api_logger
 from api.metrics import metrics
+from api.ingestion import AlertsQueue, AlertsQueueFull
 
 
 app = FastAPI()
 bot = ChanelWorkerInterface()
+alertmanager_worker = None
+alerts_queue = None
 
 
 async def process_alerts(alerts: Alerts):
     """
-    Function that processes alerts in the background to avoid /alert endpoint overload
+    Function that processes alerts in the background to avoid /alert endpoint overload.
+    Only chats related to incoming alerts are synced right away,
+    truncated notifications wake up full alerts sync.
+    Sync failure is raised after full sync is requested,
+    so queue doesn't take notification for processed one
     args:
         alerts: Incoming alerts
     """
@@ -25,22 +32,60 @@ async def process_alerts(alerts: Alerts):
         alerts.status, alerts.commonLabels)
     api_logger.debug("accept incoming alerts - %s", alerts)
 
+    if alertmanager_worker is None:
+        api_logger.warning("Alertmanager worker is not set, incoming alerts are skipped")
+        return
+
+    if alerts.truncatedAlerts is not None and alerts.truncatedAlerts > 0:
+        api_logger.info("Incoming alerts are truncated, request full sync")
+        alertmanager_worker.request_sync()
+        return
+
+    labels = {**(alerts.groupLabels or {}), **(alerts.commonLabels or {})}
     try:
-        await bot.send_alerts_to_chats(alerts)
-    except SendAlertFailed as err:
-        raise HTTPException(status_code=500, detail="Failed send alerts message") from err
+        chats_ids = bot.get_related_chats(alerts)
+        await alertmanager_worker.reconcile_alerts(labels, chats_ids)
+
+    except Exception as err:
+        api_logger.error("Failed to sync incoming alerts, request full sync. Reason is - %s", err)
+        alertmanager_worker.request_sync()
+        raise
+
+
+async def consume_alerts_queue():
+    """
+    Process queued incoming alerts in background
+    """
+    await alerts_queue.consume(process_alerts)
 
 
 @app.post("/alert")
 @version(1)
-async def alert(alerts: Alerts, background_tasks: BackgroundTasks):
+async def alert(alerts: Alerts):
     """
-    Endpoint that catches alerts messages from alertmanager
+    Endpoint that catches alerts messages from alertmanager.
+    Alerts are put into queue and processed in background,
+    503 is returned when queue is full, so alertmanager will retry later
     args:
         alerts: Incoming alerts
-        background_tasks: FastAPI defined arg
     """
-    # background_tasks.add_task(process_alerts, alerts=alerts)
+    if alerts_queue is None:
+        return Response(content="Alerts queue is not ready", status_code=503)
+
+    try:
+        queued = alerts_queue.put(alerts)
+
+    except AlertsQueueFull as err:
+        api_logger.warning(err)
+        return Response(
+            content="Alerts queue is full",
+            status_code=503,
+            headers={"Retry-After": "10"}
+        )
+
+    if not queued:
+        api_logger.debug("Incoming alerts already processed - %s", alerts.groupKey)
+        return Response(content="Alerts already processed")
 
     return Response(content="Alerts accepted")
 
@@ -58,7 +103,11 @@ async def healthcheck():
 async def get_metrics():
     """Return service metrics"""
     api_logger.debug("Response on /metrics request")
-    result_metrics = await metrics()
+    poll_interval = None
+    if alertmanager_worker is not None:
+        poll_interval = alertmanager_worker.delay
+
+    result_metrics = await metrics(alertmanager_poll_interval=poll_interval)
     return PlainTextResponse(content=result_metrics)
 
 
@@ -88,3 +137,25 @@ def set_bot(new_bot: ChanelWorkerInterface) -> None:
     global bot
     api_logger.debug("FastAPI will use specified tgbot")
     bot = new_bot
+
+
+def set_alertmanager_worker(new_alertmanager_worker) -> None:
+    """
+    Set alertmanager worker that api will use
+    args:
+        new_alertmanager_worker: AlertmanagerWorker object
+    """
+    global alertmanager_worker
+    api_logger.debug("FastAPI will use specified alertmanager worker")
+    alertmanager_worker = new_alertmanager_worker
+
+
+def set_alerts_queue(new_alerts_queue: AlertsQueue) -> None:
+    """
+    Set queue for incoming alerts
+    args:
+        new_alerts_queue: AlertsQueue object created in running event loop
+    """
+    global alerts_queue
+    api_logger.debug("FastAPI will use specified alerts queue")
+    alerts_queue = new_alerts_queue
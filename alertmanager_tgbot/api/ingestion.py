@@ -0,0 +1,155 @@
+"""Queue for incoming alerts notifications"""
+
+from asyncio import Event
+from hashlib import sha256
+from textwrap import dedent
+
+from data_models import Alerts
+from api.logger import api_logger
+
+
+# Max number of remembered digests of processed notifications
+PROCESSED_DIGESTS_LIMIT = 10000
+
+
+def get_notification_digest(alerts: Alerts) -> str:
+    """
+    Get digest of notification content.
+    Alertmanager resends the same notification on every group interval
+    with updated endsAt, so only alerts states are taken into account
+    args:
+        alerts: Incoming alerts
+    """
+    states = sorted(
+        (alert.fingerprint, alert.status, alert.startsAt)
+        for alert in alerts.alerts
+    )
+    content = repr((alerts.status, alerts.truncatedAlerts, states))
+    return sha256(content.encode("utf-8")).hexdigest()
+
+
+class AlertsQueue():
+    """
+    Bounded queue of incoming alerts notifications.
+    Notifications are deduplicated by group key and content digest,
+    newer notification of group replaces queued older one
+    args:
+        maxsize: max number of groups waiting for processing
+    """
+    def __init__(self, maxsize: int = 1000) -> None:
+        self.maxsize = maxsize
+
+        """
+        self.pending is dict with notifications waiting for processing
+        in order of arrival
+        structure is:
+        {
+            group_key: Alerts,
+            ...
+        }
+        """
+        self.pending = {}
+
+        """
+        self.processed is dict with digests of last processed notification of every group
+        structure is:
+        {
+            group_key: digest,
+            ...
+        }
+        where:
+            digest: digest generated by 'get_notification_digest' function
+        """
+        self.processed = {}
+        self.has_pending = Event()
+
+
+    def put(self, alerts: Alerts) -> bool:
+        """
+        Put notification into queue without waiting.
+        Return False when notification is duplicate of already processed one
+        args:
+            alerts: Incoming alerts
+        """
+        group_key = alerts.groupKey or ""
+        if group_key in self.pending:
+            self.pending[group_key] = alerts
+            return True
+
+        if self.processed.get(group_key) == get_notification_digest(alerts):
+            return False
+
+        if len(self.pending) >= self.maxsize:
+            raise AlertsQueueFull(self.maxsize)
+
+        self.pending[group_key] = alerts
+        self.has_pending.set()
+        return True
+
+
+    async def get(self) -> Alerts:
+        """
+        Take oldest notification from queue, wait for it if queue is empty
+        """
+        while len(self.pending) == 0:
+            self.has_pending.clear()
+            await self.has_pending.wait()
+
+        group_key = next(iter(self.pending))
+        return self.pending.pop(group_key)
+
+
+    def _remember_processed(self, group_key: str, digest: str) -> None:
+        """
+        Remember digest of processed notification of group
+        args:
+            group_key: notification group key
+            digest: digest generated by 'get_notification_digest' function
+        """
+        self.processed.pop(group_key, None)
+        self.processed[group_key] = digest
+        if len(self.processed) > PROCESSED_DIGESTS_LIMIT:
+            self.processed.pop(next(iter(self.processed)))
+
+
+    async def consume(self, handler) -> None:
+        """
+        Process notifications from queue one by one
+        args:
+            handler: coroutine function that accepts Alerts
+        """
+        while True:
+            alerts = await self.get()
+            group_key = alerts.groupKey or ""
+
+            # Notification is remembered before processing
+            # to skip its duplicates that arrive meanwhile
+            previous_digest = self.processed.get(group_key)
+            self._remember_processed(group_key, get_notification_digest(alerts))
+            try:
+                await handler(alerts)
+
+            except Exception as err:
+                api_logger.error(dedent("""\
+                    Failed to process incoming alerts. Reason is - %s
+                    """), str(err))
+                self.processed.pop(group_key, None)
+                if previous_digest is not None:
+                    self._remember_processed(group_key, previous_digest)
+
+
+# Module Exceptions
+
+
+class AlertsQueueFull(Exception):
+    """
+    Exception for cases when incoming alerts queue is full
+    args:
+        maxsize: max number of groups in queue
+    """
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        super().__init__(
+            dedent(f"""Incoming alerts queue is full.
+                Max size is - {self.maxsize}""")
+        )
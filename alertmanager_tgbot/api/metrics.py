@@ -14,9 +14,14 @@ env = Environment(
 
 template = env.get_template('metrics.j2')
 
-async def metrics():
-    """Return rendered metrics"""
+async def metrics(alertmanager_poll_interval: float = None):
+    """
+    Return rendered metrics
+    args:
+        alertmanager_poll_interval: current sleep time between requests to alertmanager
+    """
     api_logger.debug("Render metrics")
     return template.render(
-        service_uptime=uptime()
+        service_uptime=uptime(),
+        alertmanager_poll_interval=alertmanager_poll_interval
     )
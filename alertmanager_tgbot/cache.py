@@ -2,13 +2,20 @@
 
 from textwrap import dedent
 
-from data_models import BaseAlert
+from data_models import BaseAlert, EnrichedActiveAlert
 from chanel_workers.logger import tgbot_logger
+from cache_storage import CacheStorage
 
 
 class Cache():
-    """Class for storing sent alerts in RAM"""
-    def __init__(self) -> None:
+    """
+    Class for storing sent alerts in RAM.
+    With persistent storage every change is also written to it
+    and cache is loaded from it on start
+    args:
+        storage: persistent storage of cache entries
+    """
+    def __init__(self, storage: CacheStorage = None) -> None:
         """
         self.alerts is dict with alerts 
         structure is:
@@ -16,7 +23,8 @@ class Cache():
             key: {
                 "messages_ids": list(int),
                 "entity": int,
-                "alert": BaseAlert
+                "alert": BaseAlert,
+                "digest": str
             }
             ...
         }
@@ -24,6 +32,7 @@ class Cache():
             key: key generated by 'generate_key' method
             messages_ids: alert messages ids in chanel
             entity: chanel id
+            digest: digest of rendered alert message and its panes
         """
         self.alerts = {}
 
@@ -42,6 +51,64 @@ class Cache():
         """
         self.reverced_alerts = {}
 
+        self.storage = storage
+        if self.storage is not None:
+            self.load()
+
+
+    def load(self) -> None:
+        """
+        Load cache entries from persistent storage
+        """
+        for key, entity, messages_ids, alert, digest in self.storage.load():
+            try:
+                alert = EnrichedActiveAlert.model_validate_json(alert)
+            except ValueError:
+                # Messages of unreadable alerts are unknown, so they will be deleted by sync
+                tgbot_logger.warning("Failed to load alert with key %s from persistent cache", key)
+                self.storage.delete(key)
+                continue
+
+            self.alerts[key] = {
+                "messages_ids": messages_ids,
+                "entity": entity,
+                "alert": alert,
+                "digest": digest
+            }
+            for message_id in messages_ids:
+                self.reverced_alerts[f"{entity}-{message_id}"] = key
+
+        tgbot_logger.info("Loaded %s alerts from persistent cache", len(self.alerts))
+
+
+    def _store(self, key: str) -> None:
+        """
+        Write cache entry to persistent storage
+        args:
+            key: key generated by 'generate_key' method
+        """
+        if self.storage is None:
+            return
+
+        cache_alert = self.alerts[key]
+        self.storage.save(
+            key,
+            cache_alert["entity"],
+            cache_alert["messages_ids"],
+            cache_alert["alert"].model_dump_json(),
+            cache_alert["digest"]
+        )
+
+
+    def _unstore(self, key: str) -> None:
+        """
+        Delete cache entry from persistent storage
+        args:
+            key: key generated by 'generate_key' method
+        """
+        if self.storage is not None:
+            self.storage.delete(key)
+
 
     def generate_key(self, alert: BaseAlert, entity: int) -> str:
         """
@@ -109,20 +176,28 @@ class Cache():
 
         return keys
 
-    def cache_alert(self, alert: BaseAlert, entity: int, messages_ids: list) -> None:
+    def cache_alert(
+            self,
+            alert: BaseAlert,
+            entity: int,
+            messages_ids: list,
+            digest: str = None
+        ) -> None:
         """
         Caching sent alert with labels as key and entity and message id as value
         args:
             alert: Alert that was sent to chat
             entity: chat id where the alert will be sent
             messages_ids: Ids of messages with alert in chat
+            digest: digest of rendered alert message and its panes
         """
         key = self.generate_key(alert, entity)
         if key not in self.alerts:
             self.alerts[key] = {
                 "messages_ids": messages_ids,
                 "entity": entity,
-                "alert": alert
+                "alert": alert,
+                "digest": digest
             }
             tgbot_logger.debug(dedent("""\
                 Alert was cahed with key - %s
@@ -132,6 +207,7 @@ class Cache():
 
             for message_id in messages_ids:
                 self.reverced_alerts[f"{entity}-{message_id}"] = key
+            self._store(key)
 
         else:
             tgbot_logger.error(dedent("""\
@@ -142,6 +218,24 @@ class Cache():
             raise DuplicateCacheKey(alert)
 
 
+    def update_alert(self, alert: BaseAlert, entity: int, digest: str = None) -> None:
+        """
+        Replace cached alert and its message digest without changing messages
+        args:
+            alert: Actual version of cached alert
+            entity: chat id where the alert was sent
+            digest: digest of rendered alert message and its panes
+        """
+        key = self.generate_key(alert, entity)
+        cache_alert = self.get_cache_by_key(key)
+        if cache_alert["alert"] == alert and cache_alert["digest"] == digest:
+            return
+
+        cache_alert["alert"] = alert
+        cache_alert["digest"] = digest
+        self._store(key)
+
+
     def delete_alert_by_key(self, key: str) -> None:
         """
         Delete alert from cache by key
@@ -160,6 +254,7 @@ class Cache():
             messages_ids = cache_alert.get("messages_ids")
             for message_id in messages_ids:
                 self.reverced_alerts.pop(f"{entity}-{message_id}")
+            self._unstore(key)
 
         except KeyError:
             tgbot_logger.warning(dedent("""\
@@ -198,6 +293,7 @@ class Cache():
             messages_ids = cache_alert.get("messages_ids")
             for message_id in messages_ids:
                 self.reverced_alerts.pop(f"{entity}-{message_id}")
+            self._unstore(key)
 
         except KeyError:
             tgbot_logger.warning(dedent("""\
@@ -0,0 +1,75 @@
+"""Persistent storage for cache of sent alerts"""
+
+import json
+import sqlite3
+from textwrap import dedent
+
+
+class CacheStorage():
+    """
+    SQLite storage of cache entries, so cache survives restarts
+    and messages in chats are not deleted and sent again.
+    Every change is written right away, WAL journal keeps writes cheap
+    args:
+        path: path to database file
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(dedent("""\
+            CREATE TABLE IF NOT EXISTS alerts (
+                key TEXT PRIMARY KEY,
+                entity INTEGER NOT NULL,
+                messages_ids TEXT NOT NULL,
+                alert TEXT NOT NULL,
+                digest TEXT
+            )"""))
+        self.connection.commit()
+
+
+    def load(self) -> list:
+        """
+        Get all stored cache entries.
+        Result is list of tuples with key, entity, messages ids, alert json and digest
+        """
+        rows = self.connection.execute(
+            "SELECT key, entity, messages_ids, alert, digest FROM alerts"
+        ).fetchall()
+        return [
+            (key, entity, json.loads(messages_ids), alert, digest)
+            for key, entity, messages_ids, alert, digest in rows
+        ]
+
+
+    def save(self, key: str, entity: int, messages_ids: list, alert: str, digest: str = None) -> None:
+        """
+        Insert or replace cache entry
+        args:
+            key: key generated by 'Cache.generate_key' method
+            entity: chat id
+            messages_ids: alert messages ids in chat
+            alert: alert json
+            digest: digest of rendered alert message and its panes
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO alerts (key, entity, messages_ids, alert, digest) VALUES (?, ?, ?, ?, ?)",
+            (key, entity, json.dumps(messages_ids), alert, digest)
+        )
+        self.connection.commit()
+
+
+    def delete(self, key: str) -> None:
+        """
+        Delete cache entry
+        args:
+            key: key generated by 'Cache.generate_key' method
+        """
+        self.connection.execute("DELETE FROM alerts WHERE key = ?", (key,))
+        self.connection.commit()
+
+
+    def close(self) -> None:
+        """Close database connection"""
+        self.connection.close()
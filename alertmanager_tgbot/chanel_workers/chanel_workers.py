@@ -2,14 +2,30 @@
 
 from textwrap import dedent
 from telethon.sync import TelegramClient
-from asyncio import sleep
+from telethon.errors import MessageNotModifiedError
+from asyncio import gather, sleep, Lock
 
 from conf import conf
-from data_models import BaseAlert, BaseAlerts, ActiveAlerts, EnrichedActiveAlert, EnrichedActiveAlerts
+from data_models import (
+    BaseAlert,
+    BaseAlerts,
+    EnrichedActiveAlert,
+    EnrichedActiveAlerts,
+    AlertsDelta,
+    Silence
+)
 from chanel_workers.logger import tgbot_logger
 from chanel_workers.interfaces import ChanelWorkerInterface
-from cache import Cache
-from chanel_workers.formatters import format_alert_allow_undefined
+from cache import Cache, CacheKeyDoesNotExist
+from chanel_workers.formatters import RenderedAlertsCache, get_message_digest
+from chanel_workers.rate_limiters import TokenBucket
+from chanel_workers.routing import ChatsRouter
+from chanel_workers.matchers import LabelsMatcher
+from chanel_workers.expiry import SilencesExpiryScheduler
+
+
+# Max number of messages ids in one telegram request
+MESSAGES_CHUNK_SIZE = 100
 
 
 class ChanelWorker(ChanelWorkerInterface):
@@ -27,6 +43,63 @@ class ChanelWorker(ChanelWorkerInterface):
 
         self.client = client
         self.cache = cache
+        self.global_rate_limiter = None
+        self.chats_rate_limiters = {}
+        self.chats_router = None
+        self.chats_high_water_marks = {}
+        self.rendered_alerts = RenderedAlertsCache()
+        self.sync_lock = Lock()
+        self.silences_expiry = SilencesExpiryScheduler(self.remove_silence)
+
+
+    def get_chats_router(self) -> ChatsRouter:
+        """
+        Get routing index for chats from configuration.
+        Index is rebuilt only when configuration changes
+        """
+        if self.chats_router is None \
+            or not self.chats_router.is_actual(conf.CHATS, conf.DEFAULT_CHATS):
+            self.chats_router = ChatsRouter(conf.CHATS, conf.DEFAULT_CHATS)
+
+        return self.chats_router
+
+
+    def schedule_silences_expiry(self, alert: EnrichedActiveAlert) -> None:
+        """
+        Schedule expiration of silences shown in alert message
+        args:
+            alert: cached alert
+        """
+        for silence in alert.silences or []:
+            self.silences_expiry.schedule(silence)
+
+
+    async def wait_send_slot(self, entity: int) -> None:
+        """
+        Wait until message can be sent to chat without exceeding telegram limits.
+        Every chat has its own token bucket, all chats share global one
+        args:
+            entity: ID of target chat or group
+        """
+        if self.global_rate_limiter is None:
+            self.global_rate_limiter = TokenBucket(
+                rate=conf.GLOBAL_RATE_LIMIT,
+                capacity=conf.GLOBAL_RATE_BURST
+            )
+
+        if entity not in self.chats_rate_limiters:
+            rate = conf.CHAT_RATE_LIMIT
+            burst = conf.CHAT_RATE_BURST
+            for chat in conf.CHATS:
+                if int(chat.id) == int(entity):
+                    rate = chat.rate_limit or rate
+                    burst = chat.rate_burst or burst
+                    break
+
+            self.chats_rate_limiters[entity] = TokenBucket(rate=rate, capacity=burst)
+
+        await self.chats_rate_limiters[entity].acquire()
+        await self.global_rate_limiter.acquire()
 
 
     def _split_alerts_by_chats(self, alerts: BaseAlerts) -> dict:
@@ -46,54 +119,23 @@ class ChanelWorker(ChanelWorkerInterface):
             alerts: alerts that will be assigned to the corresponding chats 
         """
         try:
-            result = {}
-            for chat in conf.CHATS:
-                chat_id = chat.id
-                result[chat_id] = []
-
-                # Skip chats without labels
-                if len(chat.labels) == 0:
-                    continue
-
-                for alert in alerts.alerts:
-                    # Alerts will send if its labels is subset of chats labels
-                    if chat.labels.items() <= alert.labels.items():
-                        result[chat_id].append(alert)
-
-            # Get all alerts with defined chats
-            alerts_with_chats = [
-                alert
-                for alerts in result.values()
-                    for alert in alerts
-            ]
-
-            # Get alerts that don't have a corresponding chat
-            alerts_without_chats = [
-                alert
-                for alert in alerts.alerts
-                    if alert not in alerts_with_chats
-            ]
+            router = self.get_chats_router()
+            result = {chat_id: [] for chat_id in router.chats_ids}
 
             # If the alert was not defined for a chat, it will be sent to all default chats
-            alerts_without_chats = {
-                chat_id: alerts_without_chats
-                for chat_id in conf.DEFAULT_CHATS
-            }
-
-            for chat in alerts_without_chats:
-                if not chat in result:
-                    result[chat] = []
-                result[chat] += alerts_without_chats[chat]
-
-            result = {int(key): value for key, value in result.items()}
+            for alert in alerts.alerts:
+                for chat_id in router.route_with_defaults(alert.labels):
+                    if not chat_id in result:
+                        result[chat_id] = []
+                    result[chat_id].append(alert)
 
             return result
 
         except KeyError as err:
             tgbot_logger.error(dedent("""\
-                failed sending alerts messages to provided chat %s"""),
-                chat)
-            raise ChatHasNotID(chat) from err
+                failed sending alerts messages to provided chats %s"""),
+                conf.CHATS)
+            raise ChatHasNotID(conf.CHATS) from err
 
         except ValueError as err:
             tgbot_logger.error(dedent("""\
@@ -110,22 +152,31 @@ class ChanelWorker(ChanelWorkerInterface):
         """
         try:
             panes = [i for i in alert.panes if i is not None]
-            await sleep(2)
+            formated_alert = self.rendered_alerts.format_alert_allow_undefined(alert)
+            digest = get_message_digest(formated_alert, alert.panes)
+            await self.wait_send_slot(entity)
             if len(panes) == 0:
                 message = await self.client.send_message(
                     entity=entity,
-                    message=format_alert_allow_undefined(alert)
+                    message=formated_alert
                 )
-                self.cache.cache_alert(alert=alert, entity=entity, messages_ids=[message.id])
+                messages_ids = [message.id]
 
             else:
                 messages = await self.client.send_file(
                     entity=entity,
-                    caption=format_alert_allow_undefined(alert),
+                    caption=formated_alert,
                     file=panes
                 )
                 messages_ids = [m.id for m in messages]
-                self.cache.cache_alert(alert=alert, entity=entity, messages_ids=messages_ids)
+
+            self.cache.cache_alert(
+                alert=alert,
+                entity=entity,
+                messages_ids=messages_ids,
+                digest=digest
+            )
+            self.schedule_silences_expiry(alert)
 
             tgbot_logger.debug(dedent("""\
                 Alert was sent to chat 
@@ -150,11 +201,10 @@ class ChanelWorker(ChanelWorkerInterface):
             alert: Alert that will be sent to the entity
         """
         if len(conf.DEFAULT_CHATS) > 0:
-            for chat_id in conf.DEFAULT_CHATS:
-                try:
-                    await self.send_alert_to_chat(entity=chat_id, alert=alert)
-                except SendAlertFailed:
-                    continue
+            await gather(*[
+                self.send_alerts_to_chat(entity=chat_id, alerts=[alert])
+                for chat_id in conf.DEFAULT_CHATS
+            ])
 
         else:
             tgbot_logger.warning(dedent("""\
@@ -164,19 +214,32 @@ class ChanelWorker(ChanelWorkerInterface):
             raise NoDefaultChats(conf.DEFAULT_CHATS)
 
 
+    async def send_alerts_to_chat(self, entity: int, alerts: list) -> None:
+        """
+        Send alerts one by one to specific telegram chat
+        args:
+            entity: ID of target chat or group
+            alerts: Alerts that will be sent to the entity
+        """
+        for alert in alerts:
+            try:
+                await self.send_alert_to_chat(entity, alert)
+            except SendAlertFailed:
+                continue
+
+
     async def send_alerts_to_chats(self, income_alerts: BaseAlerts) -> None:
         """
-        Send alerts to telegram chats
+        Send alerts to telegram chats.
+        Chats are served concurrently, rate is limited by chats token buckets
         args:
             alerts: Alerts that will be sent to the relevant entity 
         """
         chat_id_alerts = self._split_alerts_by_chats(income_alerts)
-        for chat_id, alerts in chat_id_alerts.items():
-            for alert in alerts:
-                try:
-                    await self.send_alert_to_chat(chat_id, alert)
-                except SendAlertFailed:
-                    continue
+        await gather(*[
+            self.send_alerts_to_chat(chat_id, alerts)
+            for chat_id, alerts in chat_id_alerts.items()
+        ])
 
 
     async def delete_alerts_by_message_ids(self, entity: int, message_ids: list) -> None:
@@ -202,22 +265,72 @@ class ChanelWorker(ChanelWorkerInterface):
                 entity, message_ids)
 
 
+    def _chunk_cached_alerts(self, cached_alerts: list) -> list:
+        """
+        Split cached alerts into chunks for bulk telegram requests.
+        Every chunk has no more than MESSAGES_CHUNK_SIZE messages ids.
+        Result is list of tuples with cache keys and messages ids of chunk
+        args:
+            cached_alerts: list of tuples with cache key and alert messages ids
+        """
+        chunks = []
+        chunk_keys = []
+        chunk_messages_ids = []
+        for key, messages_ids in cached_alerts:
+            if len(chunk_messages_ids) + len(messages_ids) > MESSAGES_CHUNK_SIZE \
+                and len(chunk_keys) > 0:
+                chunks.append((chunk_keys, chunk_messages_ids))
+                chunk_keys = []
+                chunk_messages_ids = []
+
+            chunk_keys.append(key)
+            chunk_messages_ids += messages_ids
+
+        if len(chunk_keys) > 0:
+            chunks.append((chunk_keys, chunk_messages_ids))
+
+        return chunks
+
+
+    async def delete_cached_alerts_in_chat(self, entity: int, cached_alerts: list) -> None:
+        """
+        Delete alerts messages in specific chat with chunked bulk requests.
+        Alerts are deleted from cache only for chunks that were deleted in chat
+        args:
+            entity: ID of target chat or group
+            cached_alerts: list of tuples with cache key and alert messages ids
+        """
+        for keys, messages_ids in self._chunk_cached_alerts(cached_alerts):
+            try:
+                await self.wait_send_slot(entity)
+                await self.client.delete_messages(
+                    entity=entity,
+                    message_ids=messages_ids
+                )
+                self.cache.delete_alerts_by_key(keys)
+
+            except Exception:
+                tgbot_logger.error(dedent("""\
+                    failed to delete alerts messages by its cache keys
+                    Entity is - %s
+                    Original keys is - %s"""
+                    ),
+                    entity, keys)
+                continue
+
+
     async def delete_alerts_by_cache_keys(self, alerts_cache_keys: list) -> None:
         """
         delete alerts by cache keys
         args:
             alerts_cache_keys: List with cache keys
         """
+        entities_cached_alerts = {}
         for key in alerts_cache_keys:
             try:
                 cache = self.cache.get_cache_by_key(key)
-                await self.client.delete_messages(
-                    entity=cache.get("entity"),
-                    message_ids=cache.get("messages_ids")
-                )
-                self.cache.delete_alert_by_key(key)
 
-            except Exception:
+            except CacheKeyDoesNotExist:
                 tgbot_logger.error(dedent("""\
                     failed to delete alerts message by its cache key %s
                     Original key is - %s"""
@@ -225,6 +338,16 @@ class ChanelWorker(ChanelWorkerInterface):
                     key)
                 continue
 
+            entity = cache.get("entity")
+            if not entity in entities_cached_alerts:
+                entities_cached_alerts[entity] = []
+            entities_cached_alerts[entity].append((key, cache.get("messages_ids")))
+
+        await gather(*[
+            self.delete_cached_alerts_in_chat(entity, cached_alerts)
+            for entity, cached_alerts in entities_cached_alerts.items()
+        ])
+
 
     async def resend_alert(self,
             entity: str,
@@ -242,39 +365,38 @@ class ChanelWorker(ChanelWorkerInterface):
         await self.send_alert_to_chat(entity, alert)
 
 
-    async def update_alert(self,
-            entity: str,
+    async def edit_alert(self,
+            entity: int,
             alert: EnrichedActiveAlert,
-            original_messages: list,
-            messages_ids: list
+            message_id: int,
+            messages_ids: list,
+            updated_message: str
         ) -> None:
         """
-        Update text message for alert in chat
+        Replace text of alert message in chat and update alert in cache
         args:
             entity: ID of target chat or group
-            alerts: alert that will updated in entity
+            alert: alert that will updated in entity
+            message_id: id of message with alert text
+            messages_ids: ids of all alert messages in chat
+            updated_message: new text of alert message
         """
         try:
-            updated_message = format_alert_allow_undefined(alert)
-            for message in original_messages:
-                if message.text != updated_message and message.text != '':
-                    message = await self.client.edit_message(
-                        entity=entity,
-                        message=message.id,
-                        text=updated_message,
-                        file=alert.panes
-                    )
-
-                    self.cache.delete_alert(alert, entity)
-                    self.cache.cache_alert(alert, entity, messages_ids)
-
-                    tgbot_logger.debug(dedent("""\
-                        Alert was updated in chat 
-                        Alert labels is - %s
-                        chat id is - %s
-                        """),
-                        alert.labels, entity)
-                    break
+            await self.wait_send_slot(entity)
+            await self.client.edit_message(
+                entity=entity,
+                message=message_id,
+                text=updated_message,
+                file=alert.panes
+            )
+
+        except MessageNotModifiedError:
+            tgbot_logger.debug(dedent("""\
+                Alert message is already up to date
+                Alert labels is - %s
+                chat id is - %s
+                """),
+                alert.labels, entity)
 
         except Exception as err:
             tgbot_logger.exception(dedent("""\
@@ -284,6 +406,130 @@ class ChanelWorker(ChanelWorkerInterface):
                 entity, alert)
             raise UpdateAlertFailed(entity, alert) from err
 
+        self.cache.delete_alert(alert, entity)
+        self.cache.cache_alert(
+            alert,
+            entity,
+            messages_ids,
+            digest=get_message_digest(updated_message, alert.panes)
+        )
+        self.schedule_silences_expiry(alert)
+
+        tgbot_logger.debug(dedent("""\
+            Alert was updated in chat 
+            Alert labels is - %s
+            chat id is - %s
+            """),
+            alert.labels, entity)
+
+
+    async def update_alert(self,
+            entity: str,
+            alert: EnrichedActiveAlert,
+            original_messages: list,
+            messages_ids: list
+        ) -> None:
+        """
+        Update text message for alert in chat by comparing it with original messages
+        args:
+            entity: ID of target chat or group
+            alerts: alert that will updated in entity
+            original_messages: alert messages requested from chat
+            messages_ids: ids of all alert messages in chat
+        """
+        updated_message = self.rendered_alerts.format_alert_allow_undefined(alert)
+        for message in original_messages:
+            if message.text == '':
+                continue
+
+            if message.text != updated_message:
+                await self.edit_alert(entity, alert, message.id, messages_ids, updated_message)
+
+            else:
+                self.cache.update_alert(
+                    alert,
+                    entity,
+                    digest=get_message_digest(updated_message, alert.panes)
+                )
+                self.schedule_silences_expiry(alert)
+            break
+
+
+    async def get_messages_by_ids(self, entity: int, messages_ids: list) -> dict:
+        """
+        Get messages from chat with chunked bulk requests.
+        Result is dict with message id as key and message as value,
+        messages that does not exist in chat are skipped
+        args:
+            entity: ID of target chat or group
+            messages_ids: ids of requested messages
+        """
+        result = {}
+        for i in range(0, len(messages_ids), MESSAGES_CHUNK_SIZE):
+            chunk = messages_ids[i:i + MESSAGES_CHUNK_SIZE]
+            messages = await self.client.get_messages(entity=entity, ids=chunk)
+            for message in messages:
+                if message is not None:
+                    result[message.id] = message
+
+        return result
+
+
+    async def update_alerts_in_chat(self, entity: int, alerts: list) -> None:
+        """
+        Update text messages for alerts in specific chat.
+        Alerts are rendered locally and edited only when digest of rendered message
+        differs from cached one. Messages of alerts without cached digest
+        are requested from chat and compared by text
+        args:
+            entity: ID of target chat or group
+            alerts: alerts that will updated in entity
+        """
+        alerts_to_compare = []
+        for alert in alerts:
+            alert_cache_key = self.cache.generate_key(alert, entity)
+            alert_cache = self.cache.get_cache_by_key(alert_cache_key)
+            messages_ids = alert_cache.get("messages_ids")
+            cached_digest = alert_cache.get("digest")
+            if cached_digest is None:
+                alerts_to_compare.append((alert, messages_ids))
+                continue
+
+            updated_message = self.rendered_alerts.format_alert_allow_undefined(alert)
+            digest = get_message_digest(updated_message, alert.panes)
+            if digest == cached_digest:
+                self.cache.update_alert(alert, entity, digest=digest)
+                self.schedule_silences_expiry(alert)
+                continue
+
+            try:
+                await self.edit_alert(entity, alert, messages_ids[0], messages_ids, updated_message)
+            except UpdateAlertFailed:
+                continue
+
+        if len(alerts_to_compare) == 0:
+            return
+
+        messages = await self.get_messages_by_ids(
+            entity,
+            [
+                message_id
+                for _, messages_ids in alerts_to_compare
+                for message_id in messages_ids
+            ]
+        )
+
+        for alert, messages_ids in alerts_to_compare:
+            original_messages = [
+                messages[message_id]
+                for message_id in messages_ids
+                    if message_id in messages
+            ]
+            try:
+                await self.update_alert(entity, alert, original_messages, messages_ids)
+            except UpdateAlertFailed:
+                continue
+
 
     async def update_alerts(self, income_alerts: BaseAlerts) -> None:
         """
@@ -292,117 +538,408 @@ class ChanelWorker(ChanelWorkerInterface):
             alerts: alerts that will updated in chats
         """
         chat_id_alerts = self._split_alerts_by_chats(income_alerts)
-        for chat_id, alerts in chat_id_alerts.items():
-            for alert in alerts:
-                alert_cache_key = self.cache.generate_key(alert, chat_id)
-                alert_cache = self.cache.get_cache_by_key(alert_cache_key)
-                messages_ids = alert_cache.get("messages_ids")
-
-                original_messages = await self.client.get_messages(
-                    entity=chat_id,
-                    ids=messages_ids
-                )
-
-                await self.update_alert(chat_id, alert, original_messages, messages_ids)
+        await gather(*[
+            self.update_alerts_in_chat(chat_id, alerts)
+            for chat_id, alerts in chat_id_alerts.items()
+        ])
 
 
-    async def get_messages_ids_in_channel(self, entity: int) -> list:
+    async def get_messages_ids_in_channel(self, entity: int, min_id: int = 0) -> list:
         """
         Get all ids of messages in specified channel
         args:
             entity: ID of target chat or group
+            min_id: only messages with greater ids will be requested
         """
         ids = []
-        async for message in self.client.iter_messages(entity):
+        async for message in self.client.iter_messages(entity, min_id=min_id):
             if message.id != 1:
                 ids.append(message.id)
         return ids
 
 
+    def _get_cached_messages_ids(self, entity: int) -> set:
+        """
+        Get ids of all messages with alerts in cache for specified channel
+        args:
+            entity: ID of target chat or group
+        """
+        return set([
+            message_id
+            for cache in self.cache.get_alerts_by_entity(entity)
+            for message_id in cache.get("messages_ids")
+        ])
+
+
     async def sync_cache_with_chanel(self) -> None:
         """
-        Sync cache with real messages in chanel
+        Sync cache with new messages in chanel.
+        Only messages after high-water mark of previous sync are requested,
+        messages that disappeared from chanel later are handled by audit_chanel.
+        First sync of chanel requests its full history, so cache without
+        messages in chanel is dropped right away
         """
         tgbot_logger.info("Start to sync cache with chanels")
         for chat in conf.CHATS:
             chat_id = chat.id
             chat_id = int(chat_id)
 
-            cached_alerts = self.cache.get_alerts_by_entity(chat_id)
-            cached_ids = set([
-                message_id
-                for cache in cached_alerts
-                for message_id in cache.get("messages_ids")
-            ])
-
-            messages_ids = await self.get_messages_ids_in_channel(chat_id)
+            high_water_mark = self.chats_high_water_marks.get(chat_id, 0)
+            messages_ids = await self.get_messages_ids_in_channel(chat_id, min_id=high_water_mark)
             messages_ids = set(messages_ids)
+            if len(messages_ids) == 0 and high_water_mark > 0:
+                continue
+
+            # Cache is read after messages request to not miss alerts sent meanwhile
+            cached_ids = self._get_cached_messages_ids(chat_id)
 
             # Defining messages in chanel, but not in cache
             alerts_to_delete = messages_ids - cached_ids
-            await self.delete_alerts_by_message_ids(chat_id, alerts_to_delete)
+            if len(alerts_to_delete) > 0:
+                await self.delete_alerts_by_message_ids(chat_id, list(alerts_to_delete))
             tgbot_logger.info(dedent(f"""\
                             Alerts not in cache - {len(alerts_to_delete)}
                             """))
 
-            # Defining messages in cache, but not in chanel
-            cache_to_delete = cached_ids - messages_ids
-            cache_to_delete = self.cache.get_keys_by_entity_messageids(chat_id, cache_to_delete)
-            self.cache.delete_alerts_by_key(cache_to_delete)
-            tgbot_logger.info(dedent(f"""\
+            if high_water_mark == 0:
+                # Defining messages in cache, but not in chanel
+                cache_to_delete = cached_ids - messages_ids
+                cache_to_delete = self.cache.get_keys_by_entity_messageids(chat_id, cache_to_delete)
+                self.cache.delete_alerts_by_key(cache_to_delete)
+                tgbot_logger.info(dedent(f"""\
                             Cache without messages in chanel - {len(cache_to_delete)}
                             """))
 
+            self.chats_high_water_marks[chat_id] = max(messages_ids, default=0)
 
-    async def sync_alerts(self, active_alerts: EnrichedActiveAlerts) -> None:
+
+    async def audit_chanel(self) -> None:
         """
-        Sync alerts in chat with realy active alerts in alertmanager
+        Sync cache with all messages in chanel.
+        Full history of every chanel is requested, so it is expensive
+        and should be run rarely by audit_chanels_periodically.
+        Audit holds sync lock, so alerts sent by sync are not taken
+        for messages without cache
+        """
+        async with self.sync_lock:
+            tgbot_logger.info("Start to audit chanels")
+            for chat in conf.CHATS:
+                chat_id = chat.id
+                chat_id = int(chat_id)
+
+                messages_ids = await self.get_messages_ids_in_channel(chat_id)
+                messages_ids = set(messages_ids)
+                high_water_mark = max(messages_ids, default=0)
+
+                # Cache is read after messages request to not miss alerts sent meanwhile
+                cached_ids = self._get_cached_messages_ids(chat_id)
+
+                # Defining messages in chanel, but not in cache
+                alerts_to_delete = messages_ids - cached_ids
+                if len(alerts_to_delete) > 0:
+                    await self.delete_alerts_by_message_ids(chat_id, list(alerts_to_delete))
+                tgbot_logger.info(dedent(f"""\
+                                Alerts not in cache - {len(alerts_to_delete)}
+                                """))
+
+                # Defining messages in cache, but not in chanel.
+                # Messages sent after chanel was requested are skipped
+                cache_to_delete = set([
+                    message_id
+                    for message_id in cached_ids - messages_ids
+                        if message_id <= high_water_mark
+                ])
+                cache_to_delete = self.cache.get_keys_by_entity_messageids(chat_id, cache_to_delete)
+                self.cache.delete_alerts_by_key(cache_to_delete)
+                tgbot_logger.info(dedent(f"""\
+                                Cache without messages in chanel - {len(cache_to_delete)}
+                                """))
+
+                self.chats_high_water_marks[chat_id] = max(
+                    high_water_mark,
+                    self.chats_high_water_marks.get(chat_id, 0)
+                )
+
+
+    async def audit_chanels_periodically(self, interval: int) -> None:
+        """
+        Run full audit of chanels in background
         args:
-            active_alerts: curently active alerts from alertmanager
+            interval: sleep time in seconds between audits
+        """
+        while True:
+            await sleep(interval)
+            try:
+                await self.audit_chanel()
+
+            except Exception as err:
+                tgbot_logger.error(dedent("""\
+                    Chanels audit failed. Reason is - %s
+                    """), str(err))
+
+
+    def _get_cache_keys_by_chats(self, alerts: BaseAlerts) -> dict:
+        """
+        Generate cache keys for alerts in all related chats
+        Result is dict with following structure:
+        {
+            cache_key: (chat_id, BaseAlert),
+            ...
+        }
+        args:
+            alerts: alerts that will be assigned to the corresponding chats
         """
-        tgbot_logger.info("Start to sync alerts")
-        # Generate cache keys in one list for all income active alerts
-        chat_id_alerts = self._split_alerts_by_chats(active_alerts)
-        cache_keys_active_alerts = {}
-        for chat_id, alerts in chat_id_alerts.items():
-            for alert in alerts:
+        cache_keys_alerts = {}
+        for chat_id, chat_alerts in self._split_alerts_by_chats(alerts).items():
+            for alert in chat_alerts:
                 cache_key = self.cache.generate_key(alert, chat_id)
-                cache_keys_active_alerts[cache_key] = alert
+                cache_keys_alerts[cache_key] = (chat_id, alert)
 
-        # Generate set of cache keys for income active alerts
-        cache_keys = cache_keys_active_alerts.keys()
-        cache_keys = set(cache_keys)
+        return cache_keys_alerts
 
-        # Get set of cache keys for alerts in cache
-        cached_keys = self.cache.get_alerts()
-        cached_keys = cached_keys.keys()
-        cached_keys = set(cached_keys)
 
-        # Defining alerts to delete
-        alerts_to_delete = cached_keys - cache_keys
-        alerts_to_delete = set(alerts_to_delete)
+    async def _apply_alerts_sync(self, cache_keys_alerts: dict, alerts_to_delete: set) -> None:
+        """
+        Make chats match to specified alerts.
+        Alerts absent in cache are sent, cached ones are updated
+        args:
+            cache_keys_alerts: dict generated by '_get_cache_keys_by_chats' method
+            alerts_to_delete: cache keys of alerts that will be deleted
+        """
+        self.rendered_alerts.clear()
+
         await self.delete_alerts_by_cache_keys(alerts_to_delete)
         tgbot_logger.info(dedent(f"""\
                             Alerts to delete - {len(alerts_to_delete)}
                             """))
 
-        # Defining alerts to send
-        alerts_to_create = cache_keys - cached_keys
-        alerts_to_create = [cache_keys_active_alerts[al] for al in alerts_to_create]
-        await self.send_alerts_to_chats(ActiveAlerts(alerts=alerts_to_create))
+        cached_keys = self.cache.get_alerts()
+        alerts_to_create = {}
+        alerts_to_update = {}
+        for cache_key, (chat_id, alert) in cache_keys_alerts.items():
+            target = alerts_to_update if cache_key in cached_keys else alerts_to_create
+            if not chat_id in target:
+                target[chat_id] = []
+            target[chat_id].append(alert)
+
+        await gather(*[
+            self.send_alerts_to_chat(chat_id, alerts)
+            for chat_id, alerts in alerts_to_create.items()
+        ])
         tgbot_logger.info(dedent(f"""\
-                            Alerts to create - {len(alerts_to_create)}
+                            Alerts to create - {sum(len(a) for a in alerts_to_create.values())}
                             """))
 
-        # Defining alerts to update
-        alerts_to_update = cache_keys & cached_keys
-        alerts_to_update = [cache_keys_active_alerts[al] for al in alerts_to_update]
-        await self.update_alerts(ActiveAlerts(alerts=alerts_to_update))
+        await gather(*[
+            self.update_alerts_in_chat(chat_id, alerts)
+            for chat_id, alerts in alerts_to_update.items()
+        ])
         tgbot_logger.info(dedent(f"""\
-                            Existing alerts - {len(alerts_to_update)}
+                            Existing alerts - {sum(len(a) for a in alerts_to_update.values())}
                             """))
 
-        await self.sync_cache_with_chanel()
+
+    async def sync_alerts(self, active_alerts: EnrichedActiveAlerts) -> None:
+        """
+        Sync alerts in chat with realy active alerts in alertmanager
+        args:
+            active_alerts: curently active alerts from alertmanager
+        """
+        async with self.sync_lock:
+            tgbot_logger.info("Start to sync alerts")
+            cache_keys_alerts = self._get_cache_keys_by_chats(active_alerts)
+
+            # Defining alerts to delete
+            alerts_to_delete = set(self.cache.get_alerts().keys()) - set(cache_keys_alerts.keys())
+
+            await self._apply_alerts_sync(cache_keys_alerts, alerts_to_delete)
+            await self.sync_cache_with_chanel()
+
+
+    async def sync_alerts_delta(self, delta: AlertsDelta) -> None:
+        """
+        Sync alerts in chat with alerts changed in alertmanager since previous sync
+        args:
+            delta: difference between current and previous active alerts
+        """
+        async with self.sync_lock:
+            tgbot_logger.info("Start to sync changed alerts")
+            cache_keys_alerts = self._get_cache_keys_by_chats(
+                EnrichedActiveAlerts(alerts=delta.added + delta.changed)
+            )
+
+            # Defining alerts to delete. Changed alerts can keep their cache keys
+            removed_keys = self._get_cache_keys_by_chats(EnrichedActiveAlerts(alerts=delta.removed))
+            alerts_to_delete = set([
+                cache_key
+                for cache_key in removed_keys
+                    if cache_key not in cache_keys_alerts
+                    and cache_key in self.cache.get_alerts()
+            ])
+
+            await self._apply_alerts_sync(cache_keys_alerts, alerts_to_delete)
+            await self.sync_cache_with_chanel()
+
+
+    async def sync_alerts_scope(
+            self,
+            active_alerts: EnrichedActiveAlerts,
+            chats_ids: list,
+            labels: dict
+        ) -> None:
+        """
+        Sync alerts in specified chats only for alerts with specified labels.
+        Alerts in other chats or without that labels are not touched
+        args:
+            active_alerts: curently active alerts from alertmanager with specified labels
+            chats_ids: ids of chats where alerts will be synced
+            labels: labels that all synced alerts have
+        """
+        async with self.sync_lock:
+            tgbot_logger.info("Start to sync alerts in chats %s", chats_ids)
+            cache_keys_alerts = {
+                cache_key: (chat_id, alert)
+                for cache_key, (chat_id, alert) in self._get_cache_keys_by_chats(active_alerts).items()
+                    if chat_id in chats_ids
+            }
+
+            # Defining alerts to delete
+            alerts_to_delete = set([
+                cache_key
+                for cache_key, cache in self.cache.get_alerts().items()
+                    if cache.get("entity") in chats_ids
+                    and labels.items() <= cache.get("alert").labels.items()
+                    and cache_key not in cache_keys_alerts
+            ])
+
+            await self._apply_alerts_sync(cache_keys_alerts, alerts_to_delete)
+
+
+    async def edit_cached_alerts(self, updated_alerts: dict) -> None:
+        """
+        Render and edit messages of cached alerts, chats are edited concurrently
+        args:
+            updated_alerts: dict with chat id as key and list of
+                tuples with updated alert and its messages ids as value
+        """
+        async def edit_alerts_in_chat(entity, alerts):
+            for alert, messages_ids in alerts:
+                updated_message = self.rendered_alerts.format_alert_allow_undefined(alert)
+                try:
+                    await self.edit_alert(entity, alert, messages_ids[0], messages_ids, updated_message)
+                except UpdateAlertFailed:
+                    continue
+
+        await gather(*[
+            edit_alerts_in_chat(entity, alerts)
+            for entity, alerts in updated_alerts.items()
+        ])
+
+
+    async def apply_silence(self, silence: Silence) -> None:
+        """
+        Show silence in messages of cached alerts matched by it right away,
+        without waiting for next sync with alertmanager
+        args:
+            silence: created silence
+        """
+        # Messages are found and edited under sync lock,
+        # so sync can't delete or resend them meanwhile
+        async with self.sync_lock:
+            matcher = LabelsMatcher(silence.matchers)
+            updated_alerts = {}
+            for cache in list(self.cache.get_alerts().values()):
+                alert = cache.get("alert")
+                if not matcher.matches(alert.labels) \
+                    or silence.id in alert.status.silencedBy:
+                    continue
+
+                status = alert.status.model_copy(update={
+                    "state": "suppressed",
+                    "silencedBy": alert.status.silencedBy + [silence.id]
+                })
+                alert = alert.model_copy(update={
+                    "status": status,
+                    "silences": (alert.silences or []) + [silence]
+                })
+                updated_alerts.setdefault(cache.get("entity"), []).append(
+                    (alert, cache.get("messages_ids"))
+                )
+
+            tgbot_logger.info(
+                "Silence %s applied to %s alerts messages",
+                silence.id, sum(len(alerts) for alerts in updated_alerts.values())
+            )
+            await self.edit_cached_alerts(updated_alerts)
+
+
+    async def remove_silence(self, silence_id: str) -> None:
+        """
+        Remove silence from messages of cached alerts muted by it right away,
+        without waiting for next sync with alertmanager
+        args:
+            silence_id: id of deleted or expired silence
+        """
+        self.silences_expiry.unschedule(silence_id)
+        # Messages are found and edited under sync lock,
+        # so sync can't delete or resend them meanwhile
+        async with self.sync_lock:
+            updated_alerts = {}
+            for cache in list(self.cache.get_alerts().values()):
+                alert = cache.get("alert")
+                silences = [
+                    silence for silence in alert.silences or []
+                        if silence.id != silence_id
+                ]
+                silenced_by = [
+                    silence for silence in alert.status.silencedBy
+                        if silence != silence_id
+                ]
+                if len(silences) == len(alert.silences or []) \
+                    and len(silenced_by) == len(alert.status.silencedBy):
+                    continue
+
+                status = alert.status.model_copy(update={
+                    "state": "suppressed" if silenced_by else "active",
+                    "silencedBy": silenced_by
+                })
+                alert = alert.model_copy(update={
+                    "status": status,
+                    "silences": silences
+                })
+                updated_alerts.setdefault(cache.get("entity"), []).append(
+                    (alert, cache.get("messages_ids"))
+                )
+
+            tgbot_logger.info(
+                "Silence %s removed from %s alerts messages",
+                silence_id, sum(len(alerts) for alerts in updated_alerts.values())
+            )
+            await self.edit_cached_alerts(updated_alerts)
+
+
+    async def expire_silences_on_time(self) -> None:
+        """
+        Remove silences from alerts messages exactly when silences expire,
+        only messages of alerts muted by expired silence are edited
+        """
+        await self.silences_expiry.run()
+
+
+    def get_related_chats(self, alerts: BaseAlerts) -> list:
+        """
+        Get ids of all chats where specified alerts will be sent
+        args:
+            alerts: alerts that will be assigned to the corresponding chats
+        """
+        router = self.get_chats_router()
+        chats_ids = []
+        for alert in alerts.alerts:
+            for chat_id in router.route_with_defaults(alert.labels):
+                if chat_id not in chats_ids:
+                    chats_ids.append(chat_id)
+
+        return chats_ids
 
 
 # Module Exceptions
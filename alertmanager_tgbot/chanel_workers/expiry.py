@@ -0,0 +1,106 @@
+"""Scheduler of silences expiration"""
+
+import heapq
+from asyncio import Event, wait_for, TimeoutError as AsyncTimeoutError
+from textwrap import dedent
+from time import time
+
+from data_models import Silence
+from chanel_workers.formatters import get_timestamp
+from chanel_workers.logger import tgbot_logger
+
+
+class SilencesExpiryScheduler():
+    """
+    Min-heap of silences by their endsAt.
+    Callback is called for every silence exactly when it expires
+    args:
+        on_expire: coroutine function that accepts id of expired silence
+    """
+    def __init__(self, on_expire) -> None:
+        self.on_expire = on_expire
+
+        # Heap with tuples (expires_at, silence_id)
+        self.heap = []
+
+        """
+        self.scheduled is dict with actual expiration time of scheduled silences,
+        heap entries with other time are outdated and skipped
+        structure is:
+        {
+            silence_id: expires_at,
+            ...
+        }
+        where:
+            expires_at: unix timestamp of silence endsAt
+        """
+        self.scheduled = {}
+        self.rescheduled = Event()
+
+
+    def schedule(self, silence: Silence) -> None:
+        """
+        Schedule silence expiration, silence with changed endsAt is rescheduled
+        args:
+            silence: silence shown in alerts messages
+        """
+        expires_at = get_timestamp(silence.endsAt)
+        if self.scheduled.get(silence.id) == expires_at:
+            return
+
+        self.scheduled[silence.id] = expires_at
+        heapq.heappush(self.heap, (expires_at, silence.id))
+
+        # Sleeping scheduler must wake up earlier for new nearest silence
+        if self.heap[0] == (expires_at, silence.id):
+            self.rescheduled.set()
+
+
+    def unschedule(self, silence_id: str) -> None:
+        """
+        Cancel silence expiration, its heap entry is skipped later
+        args:
+            silence_id: id of silence
+        """
+        self.scheduled.pop(silence_id, None)
+
+
+    def _drop_outdated(self) -> None:
+        """Remove outdated entries from top of heap"""
+        while self.heap:
+            expires_at, silence_id = self.heap[0]
+            if self.scheduled.get(silence_id) == expires_at:
+                return
+            heapq.heappop(self.heap)
+
+
+    async def run(self) -> None:
+        """
+        Sleep until nearest silence expires and call callback for all expired silences
+        """
+        while True:
+            self._drop_outdated()
+            timeout = None
+            if self.heap:
+                timeout = max(self.heap[0][0] - time(), 0)
+
+            try:
+                await wait_for(self.rescheduled.wait(), timeout=timeout)
+            except AsyncTimeoutError:
+                pass
+            self.rescheduled.clear()
+
+            now = time()
+            self._drop_outdated()
+            while self.heap and self.heap[0][0] <= now:
+                _, silence_id = heapq.heappop(self.heap)
+                self.scheduled.pop(silence_id, None)
+                try:
+                    await self.on_expire(silence_id)
+
+                except Exception as err:
+                    tgbot_logger.error(dedent("""\
+                        Expired silence %s was not removed from messages. Reason is - %s
+                        """), silence_id, str(err))
+
+                self._drop_outdated()
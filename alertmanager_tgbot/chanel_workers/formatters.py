@@ -3,10 +3,13 @@ Module with tools to format datamodels
 into pretty telegram messages and back
 """
 
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from hashlib import sha256
 from textwrap import dedent
 import dateparser
-from jinja2 import Template, StrictUndefined
-from jinja2.filters import FILTERS
+from jinja2 import Environment, Template, StrictUndefined
 from jinja2.exceptions import UndefinedError
 
 from data_models import BaseAlert
@@ -14,7 +17,68 @@ from conf import conf
 from chanel_workers.logger import tgbot_logger
 
 
+# Max number of rendered alerts kept between sync cycles
+RENDERED_ALERTS_LIMIT = 4096
+
+RFC3339_DATE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?([Zz]|[+-]\d{2}:\d{2})?$"
+)
+
+
+def parse_rfc3339_date(value: str) -> datetime:
+    """
+    Strictly parse RFC 3339 date like ones in alertmanager responses.
+    Fractional seconds are truncated to microseconds
+    args
+        value: date string
+    """
+    match = RFC3339_DATE.match(value)
+    if match is None:
+        raise ValueError(f"Date {value} is not in RFC 3339 format")
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    microsecond = int((fraction or "0")[:6].ljust(6, "0"))
+
+    if offset is None:
+        tzinfo = None
+    elif offset in ("Z", "z"):
+        tzinfo = timezone.utc
+    else:
+        sign = -1 if offset[0] == "-" else 1
+        tzinfo = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6])))
+
+    return datetime(
+        int(year), int(month), int(day),
+        int(hour), int(minute), int(second),
+        microsecond, tzinfo=tzinfo
+    )
+
+
+def parse_date(value: str) -> datetime:
+    """
+    Parse date string. RFC 3339 dates are parsed with fast strict parser,
+    all other formats are parsed by dateparser
+    args
+        value: date string
+    """
+    try:
+        return parse_rfc3339_date(value)
+    except ValueError:
+        return dateparser.parse(value)
+
+
+def get_timestamp(value: str) -> float:
+    """
+    Get unix timestamp of date from alertmanager or from mute command.
+    Dates without timezone are considered local
+    args
+        value: date string
+    """
+    return parse_date(value).astimezone(timezone.utc).timestamp()
+
+
 # Custom filters
+@lru_cache(maxsize=4096)
 def format_date(value, target_format='%b %d %Y %H:%M:%S'):
     """
     Format original iso format in alert to specific string
@@ -22,10 +86,50 @@ def format_date(value, target_format='%b %d %Y %H:%M:%S'):
         value: original not formated date
         target_format: format that value will converted
     """
-    return dateparser.parse(value).strftime(target_format)
+    return parse_date(value).strftime(target_format)
+
+
+class TemplatesRegistry():
+    """
+    Registry of compiled jinja2 templates.
+    Every template is compiled once and compiled again
+    only when its source in configuration changes
+    """
+    def __init__(self) -> None:
+        self.environment = Environment()
+        self.strict_environment = Environment(undefined=StrictUndefined)
+        for environment in (self.environment, self.strict_environment):
+            environment.filters["format_date"] = format_date
+
+        """
+        self.templates is dict with compiled templates
+        structure is:
+        {
+            (name, strict): (source, Template),
+            ...
+        }
+        """
+        self.templates = {}
+
+
+    def get_template(self, name: str, source: str, strict: bool = False) -> Template:
+        """
+        Get compiled template
+        args:
+            name: template name, i.e. alert or resolve
+            source: template source from configuration
+            strict: raise error on undefined variables
+        """
+        cached = self.templates.get((name, strict))
+        if cached is None or cached[0] != source:
+            environment = self.strict_environment if strict else self.environment
+            cached = (source, environment.from_string(source))
+            self.templates[(name, strict)] = cached
 
+        return cached[1]
 
-FILTERS["format_date"] = format_date
+
+templates_registry = TemplatesRegistry()
 
 
 def format_alert(alert: BaseAlert) -> str:
@@ -35,7 +139,7 @@ def format_alert(alert: BaseAlert) -> str:
         alert: original alert
     """
     try:
-        template = Template(conf.ALERT_TEMPLATE, undefined=StrictUndefined)
+        template = templates_registry.get_template("alert", conf.ALERT_TEMPLATE, strict=True)
         formated = template.render(**alert.dict())
         return formated
 
@@ -55,7 +159,7 @@ def format_alert_allow_undefined(alert: BaseAlert) -> str:
     args
         alert: original alert
     """
-    template = Template(conf.ALERT_TEMPLATE)
+    template = templates_registry.get_template("alert", conf.ALERT_TEMPLATE)
     formated = template.render(**alert.dict())
     return formated
 
@@ -67,7 +171,7 @@ def format_resolve(alert: BaseAlert) -> str:
         alert: original resolve alert
     """
     try:
-        template = Template(conf.RESOLVE_TEMPLATE, undefined=StrictUndefined)
+        template = templates_registry.get_template("resolve", conf.RESOLVE_TEMPLATE, strict=True)
         formated = template.render(**alert.dict())
         return formated
 
@@ -87,11 +191,78 @@ def format_resolve_allow_undefined(alert: BaseAlert) -> str:
     args
         alert: original resolve alert
     """
-    template = Template(conf.RESOLVE_TEMPLATE)
+    template = templates_registry.get_template("resolve", conf.RESOLVE_TEMPLATE)
     formated = template.render(**alert.dict())
     return formated
 
 
+class RenderedAlertsCache():
+    """
+    Cache of rendered alerts messages.
+    Alert is rendered once for every its content and template,
+    no matter how many chats it is sent to.
+    Cache is cleared by sync of alerts, renders made between syncs,
+    i.e. by silences shown right away, are limited by least recently used ones
+    """
+    def __init__(self) -> None:
+        """
+        self.rendered is dict with rendered alerts
+        structure is:
+        {
+            (template, alert_digest): str,
+            ...
+        }
+        where:
+            template: source of template used for rendering
+            alert_digest: digest generated by 'get_alert_digest' function
+        """
+        self.rendered = {}
+
+
+    def format_alert_allow_undefined(self, alert: BaseAlert) -> str:
+        """
+        Format data model alert into string and ignore undefined variables
+        args
+            alert: original alert
+        """
+        key = (conf.ALERT_TEMPLATE, get_alert_digest(alert))
+        rendered = self.rendered.pop(key, None)
+        if rendered is None:
+            rendered = format_alert_allow_undefined(alert)
+
+        self.rendered[key] = rendered
+        if len(self.rendered) > RENDERED_ALERTS_LIMIT:
+            self.rendered.pop(next(iter(self.rendered)))
+        return rendered
+
+
+    def clear(self) -> None:
+        """Drop all rendered alerts"""
+        self.rendered = {}
+
+
+def get_alert_digest(alert: BaseAlert) -> str:
+    """
+    Get digest of alert content
+    args
+        alert: original alert
+    """
+    return sha256(alert.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def get_message_digest(text: str, panes: list) -> str:
+    """
+    Get digest of rendered alert message and its attached panes
+    args
+        text: rendered alert message
+        panes: panes attached to message
+    """
+    digest = sha256(text.encode("utf-8"))
+    for pane in panes or []:
+        digest.update(b"\0" + str(pane).encode("utf-8"))
+    return digest.hexdigest()
+
+
 class AlertHasNotFieldsForTemplate(Exception):
     """
     Exception for cases when render with jinja failed
@@ -2,7 +2,7 @@
 
 from abc import abstractmethod
 
-from data_models import BaseAlert, BaseAlerts, EnrichedActiveAlerts
+from data_models import BaseAlert, BaseAlerts, EnrichedActiveAlerts, AlertsDelta, Silence
 
 
 class ChanelWorkerInterface():
@@ -26,6 +26,16 @@ class ChanelWorkerInterface():
         """
 
 
+    @abstractmethod
+    async def send_alerts_to_chat(self, entity: int, alerts: list) -> None:
+        """
+        Send alerts one by one to specific telegram chat
+        args:
+            entity: ID of target chat or group
+            alerts: Alerts that will be sent to the entity
+        """
+
+
     @abstractmethod
     async def send_alert_to_default_chats(self, alert: BaseAlert) -> None:
         """
@@ -54,6 +64,16 @@ class ChanelWorkerInterface():
         """
 
 
+    @abstractmethod
+    async def delete_cached_alerts_in_chat(self, entity: int, cached_alerts: list) -> None:
+        """
+        Delete alerts messages in specific chat with chunked bulk requests
+        args:
+            entity: ID of target chat or group
+            cached_alerts: list of tuples with cache key and alert messages ids
+        """
+
+
     @abstractmethod
     async def delete_alerts_by_cache_keys(self, alerts_cache_keys: list) -> None:
         """
@@ -63,6 +83,25 @@ class ChanelWorkerInterface():
         """
 
 
+    @abstractmethod
+    async def edit_alert(self,
+            entity: int,
+            alert: BaseAlert,
+            message_id: int,
+            messages_ids: list,
+            updated_message: str
+        ) -> None:
+        """
+        Replace text of alert message in chat and update alert in cache
+        args:
+            entity: ID of target chat or group
+            alert: alert that will updated in entity
+            message_id: id of message with alert text
+            messages_ids: ids of all alert messages in chat
+            updated_message: new text of alert message
+        """
+
+
     @abstractmethod
     async def update_alert(self, entity: int, alert: BaseAlerts) -> None:
         """
@@ -73,6 +112,16 @@ class ChanelWorkerInterface():
         """
 
 
+    @abstractmethod
+    async def update_alerts_in_chat(self, entity: int, alerts: list) -> None:
+        """
+        Update text messages for alerts in specific chat
+        args:
+            entity: ID of target chat or group
+            alerts: alerts that will updated in entity
+        """
+
+
     @abstractmethod
     async def update_alerts(self, alerts: BaseAlerts) -> None:
         """
@@ -83,18 +132,35 @@ class ChanelWorkerInterface():
 
 
     @abstractmethod
-    async def get_messages_ids_in_channel(self, entity: int) -> list:
+    async def get_messages_ids_in_channel(self, entity: int, min_id: int = 0) -> list:
         """
         Get all ids of messages in specified channel
         args:
             entity: ID of target chat or group
+            min_id: only messages with greater ids will be requested
         """
 
 
     @abstractmethod
     async def sync_cache_with_chanel(self) -> None:
         """
-        Sync cache with real messages in chanel
+        Sync cache with new messages in chanel
+        """
+
+
+    @abstractmethod
+    async def audit_chanel(self) -> None:
+        """
+        Sync cache with all messages in chanel
+        """
+
+
+    @abstractmethod
+    async def audit_chanels_periodically(self, interval: int) -> None:
+        """
+        Run full audit of chanels in background
+        args:
+            interval: sleep time in seconds between audits
         """
 
 
@@ -105,3 +171,62 @@ class ChanelWorkerInterface():
         args:
             active_alerts: curently active alerts from alertmanager
         """
+
+
+    @abstractmethod
+    async def sync_alerts_delta(self, delta: AlertsDelta) -> None:
+        """
+        Sync alerts in group with alerts changed in alertmanager since previous sync
+        args:
+            delta: difference between current and previous active alerts
+        """
+
+
+    @abstractmethod
+    async def sync_alerts_scope(
+            self,
+            active_alerts: EnrichedActiveAlerts,
+            chats_ids: list,
+            labels: dict
+        ) -> None:
+        """
+        Sync alerts in specified chats only for alerts with specified labels
+        args:
+            active_alerts: curently active alerts from alertmanager with specified labels
+            chats_ids: ids of chats where alerts will be synced
+            labels: labels that all synced alerts have
+        """
+
+
+    @abstractmethod
+    async def apply_silence(self, silence: Silence) -> None:
+        """
+        Show silence in messages of cached alerts matched by it right away
+        args:
+            silence: created silence
+        """
+
+
+    @abstractmethod
+    async def remove_silence(self, silence_id: str) -> None:
+        """
+        Remove silence from messages of cached alerts muted by it right away
+        args:
+            silence_id: id of deleted silence
+        """
+
+
+    @abstractmethod
+    async def expire_silences_on_time(self) -> None:
+        """
+        Remove silences from alerts messages exactly when silences expire
+        """
+
+
+    @abstractmethod
+    def get_related_chats(self, alerts: BaseAlerts) -> list:
+        """
+        Get ids of all chats where specified alerts will be sent
+        args:
+            alerts: alerts that will be assigned to the corresponding chats
+        """
@@ -0,0 +1,54 @@
+"""Local matching of alerts labels with silences matchers"""
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def compile_regex(value: str) -> re.Pattern:
+    """
+    Compile matcher regex once for all silences with it
+    args:
+        value: matcher regex
+    """
+    return re.compile(value)
+
+
+class LabelsMatcher():
+    """
+    Compiled silence matchers.
+    Alertmanager semantics are used: regex must match whole label value,
+    absent label is matched as empty string, all matchers must match labels
+    args:
+        matchers: list of MuteMatcher
+    """
+    def __init__(self, matchers: list) -> None:
+        self.matchers = [
+            (
+                matcher.name,
+                compile_regex(matcher.value) if matcher.isRegex else matcher.value,
+                matcher.isRegex,
+                matcher.isEqual is not False
+            )
+            for matcher in matchers
+        ]
+
+
+    def matches(self, labels: dict) -> bool:
+        """
+        Check that labels match all matchers
+        args:
+            labels: alert labels
+        """
+        for name, value, is_regex, is_equal in self.matchers:
+            label_value = labels.get(name, "")
+            if is_regex:
+                matched = value.fullmatch(label_value) is not None
+            else:
+                matched = label_value == value
+
+            if matched != is_equal:
+                return False
+
+        return True
+
@@ -0,0 +1,45 @@
+"""Rate limiters for requests to telegram"""
+
+from asyncio import Lock, sleep
+from time import monotonic
+
+
+class TokenBucket():
+    """
+    Token bucket rate limiter.
+    Tokens are added with constant rate up to capacity,
+    every request takes one token or waits until it will be added
+    args:
+        rate: number of tokens added per minute
+        capacity: max number of tokens, i.e. size of allowed burst
+    """
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate / 60
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated_at = monotonic()
+        self.lock = Lock()
+
+
+    def _refill(self) -> None:
+        """Add tokens accumulated since last refill"""
+        now = monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+
+    async def acquire(self) -> None:
+        """
+        Take one token, wait for it if bucket is empty.
+        Waiters are served in order of arrival
+        """
+        async with self.lock:
+            self._refill()
+            while self.tokens < 1:
+                await sleep((1 - self.tokens) / self.rate)
+                self._refill()
+
+            self.tokens -= 1
@@ -0,0 +1,79 @@
+"""Index for routing alerts to chats by labels"""
+
+
+class ChatsRouter():
+    """
+    Inverted index of chats labels.
+    Chat is related to alert when all chat labels are present in alert labels,
+    so alert is routed by counting matched labels for every candidate chat
+    args:
+        chats: chats from configuration
+        default_chats: ids of chats for alerts without related chats
+    """
+    def __init__(self, chats: list, default_chats: list) -> None:
+        self.chats = chats
+        self.default_chats = default_chats
+        self.chats_ids = []
+        self.default_chats_ids = [int(chat_id) for chat_id in default_chats or []]
+
+        # (label, value) -> indexes of chats in configuration with that label
+        self.labels_index = {}
+
+        # Index of chat in configuration -> number of labels required by chat
+        self.required_labels_count = {}
+
+        for chat_index, chat in enumerate(chats or []):
+            chat_id = int(chat.id)
+            self.chats_ids.append(chat_id)
+
+            # Skip chats without labels
+            if len(chat.labels) == 0:
+                continue
+
+            self.required_labels_count[chat_index] = len(chat.labels)
+            for label in chat.labels.items():
+                self.labels_index.setdefault(label, []).append(chat_index)
+
+
+    def is_actual(self, chats: list, default_chats: list) -> bool:
+        """
+        Check that index was built from specified configuration
+        args:
+            chats: chats from configuration
+            default_chats: ids of chats for alerts without related chats
+        """
+        return self.chats is chats and self.default_chats is default_chats
+
+
+    def route(self, labels: dict) -> list:
+        """
+        Get ids of chats related to labels. Empty list if there are no related chats
+        args:
+            labels: alert labels
+        """
+        matched_labels_count = {}
+        for label in labels.items():
+            for chat_index in self.labels_index.get(label, ()):
+                matched_labels_count[chat_index] = matched_labels_count.get(chat_index, 0) + 1
+
+        chats_ids = []
+        for chat_index in sorted(matched_labels_count):
+            if matched_labels_count[chat_index] == self.required_labels_count[chat_index]:
+                chat_id = self.chats_ids[chat_index]
+                if chat_id not in chats_ids:
+                    chats_ids.append(chat_id)
+
+        return chats_ids
+
+
+    def route_with_defaults(self, labels: dict) -> list:
+        """
+        Get ids of chats related to labels or default chats if there are no related chats
+        args:
+            labels: alert labels
+        """
+        chats_ids = self.route(labels)
+        if len(chats_ids) == 0:
+            return self.default_chats_ids
+        return chats_ids
+
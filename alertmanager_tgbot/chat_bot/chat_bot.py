@@ -1,6 +1,6 @@
 """Users interaction module"""
 
-from asyncio import sleep
+from asyncio import sleep, gather, Semaphore
 from textwrap import dedent
 from yaml import safe_dump
 from telethon.sync import TelegramClient, events
@@ -8,10 +8,17 @@ from telethon.sync import TelegramClient, events
 from .logger import chatbot_logger
 from .acl import is_operation_permitted
 from conf import conf
-from cache import Cache
-from chat_bot.parsers import parse_silence_command, parse_mute_command, get_help
+from cache import Cache, CacheKeyDoesNotExist
+from chat_bot.parsers import (
+    parse_silence_command,
+    parse_mute_arguments,
+    parse_mute_command,
+    parse_grouped_mute_command,
+    get_help
+)
 from alertmanager_workers import AlertmanagerWorker, AlertHasntSilence
 from grafana_workers import GrafanaWorker
+from chanel_workers import ChanelWorkerInterface
 
 
 class ChatBot():
@@ -20,20 +27,24 @@ class ChatBot():
     args:
         client: Telegram client that will work with chats
         cache: Object of Cache class, where cache will stored
+        chanel_worker: worker of alerts chats where silences changes are shown right away
     """
     def __init__(
             self,
             client: TelegramClient,
             cache: Cache,
             alertmanager_worker: AlertmanagerWorker,
-            grafana_worker: GrafanaWorker
+            grafana_worker: GrafanaWorker,
+            chanel_worker: ChanelWorkerInterface = None
         ) -> None:
 
         self.client = client
         self.cache = cache
         self.alertmanager_worker = alertmanager_worker
         self.grafana_worker = grafana_worker
+        self.chanel_worker = chanel_worker
         self.forwards_stack = {}
+        self.silences_semaphore = Semaphore(conf.SILENCE_CONCURRENCY)
 
         self.client.add_event_handler(
             self.ping,
@@ -141,6 +152,7 @@ class ChatBot():
                 reply_to=event.message.id,
                 message=f"Silence created with id {silence_id}"
             )
+            await self.show_silences_changes(created_ids=[silence_id])
 
         except Exception as err:
             chatbot_logger.error("Silence create failed with error: \n%s", err)
@@ -151,6 +163,87 @@ class ChatBot():
             )
 
 
+    def get_forwarded_alerts(self, forwards: list) -> tuple:
+        """
+        Get cached alerts of forwarded alerts messages.
+        Alerts can be resolved while they are forwarded, so forwards without
+        cached alerts don't abort the batch. Result is tuple with cached alerts
+        and list of tuples with description and error of every failed forward
+        args:
+            forwards: forwarded messages events
+        """
+        alerts = []
+        failures = []
+        for forward in forwards:
+            if forward.message.text != '':
+                chat_id = forward.message.forward.chat_id
+                message_id = forward.message.forward.channel_post
+                if not chat_id in conf.CHATS_IDS:
+                    raise ForwardFromUnknownChat(chat_id)
+
+                alert_cache_keys = self.cache.get_keys_by_entity_messageids(
+                    entity=chat_id,
+                    messsages_ids=[message_id]
+                )
+                alert_cache_key = alert_cache_keys[0]
+                if alert_cache_key is None:
+                    failures.append((f"message {message_id}", AlertNotCached(chat_id, message_id)))
+                    continue
+
+                try:
+                    alert = self.cache.get_cache_by_key(alert_cache_key)
+                except CacheKeyDoesNotExist:
+                    failures.append((f"message {message_id}", AlertNotCached(chat_id, message_id)))
+                    continue
+
+                alerts.append(alert.get('alert'))
+
+        return alerts, failures
+
+
+    async def show_silences_changes(self, created_ids: list = [], deleted_ids: list = []) -> None:
+        """
+        Show created and deleted silences in alerts messages right away.
+        Failures are only logged, messages will be updated by next sync anyway
+        args:
+            created_ids: ids of created silences
+            deleted_ids: ids of deleted silences
+        """
+        if self.chanel_worker is None:
+            return
+
+        try:
+            for silence_id in created_ids:
+                silence = self.alertmanager_worker.silence_index.get(silence_id)
+                if silence is not None:
+                    await self.chanel_worker.apply_silence(silence)
+
+            for silence_id in deleted_ids:
+                await self.chanel_worker.remove_silence(silence_id)
+
+        except Exception as err:
+            chatbot_logger.error("Silences changes show failed with error: \n%s", err)
+
+
+    async def run_silences_operation(self, operation, items: list) -> list:
+        """
+        Run silences operation for every item concurrently,
+        number of simultaneous requests to alertmanager is limited.
+        Result is list with silence id or exception for every item
+        args:
+            operation: coroutine function that accepts item and returns silence id
+            items: cached alerts or mutes
+        """
+        async def limited_operation(item):
+            async with self.silences_semaphore:
+                return await operation(item)
+
+        return await gather(
+            *[limited_operation(item) for item in items],
+            return_exceptions=True
+        )
+
+
     async def mute(self, event: events.NewMessage):
         """
         Handle mute alerts command
@@ -172,40 +265,60 @@ class ChatBot():
                 or len(self.forwards_stack[event.chat_id]) == 0:
                 raise AlertsNotSpecified()
 
-            silences_ids = []
-            alerts = self.forwards_stack.pop(event.chat_id)
-            for alert in alerts:
-                if alert.message.text != '':
-                    if not alert.message.forward.chat_id in conf.CHATS_IDS:
-                        raise ForwardFromUnknownChat(alert.message.forward.chat_id)
-
-                    alert_cache_keys = self.cache.get_keys_by_entity_messageids(
-                        entity=alert.message.forward.chat_id,
-                        messsages_ids=[alert.message.forward.channel_post]
-                    )
-                    alert_cache_key = alert_cache_keys[0]
-                    alert = self.cache.get_cache_by_key(alert_cache_key)
-                    alert = alert.get('alert')
-                    mute = parse_mute_command(command, alert)
-                    mute.createdBy = sender.username
-                    silence_id = await self.alertmanager_worker.create_silence(mute)
-                    silences_ids.append(silence_id)
-
-                    chatbot_logger.info(
-                        "Alert muted with silence id - %s",
-                        silence_id
-                    )
+            args = parse_mute_arguments(command)
+            forwards = self.forwards_stack.pop(event.chat_id)
+            alerts, failures = self.get_forwarded_alerts(forwards)
+
+            # Every mute is a tuple with Mute and alerts covered by it
+            if args["group"]:
+                mutes = parse_grouped_mute_command(command, alerts)
+            else:
+                mutes = [
+                    (parse_mute_command(command, alert), [alert])
+                    for alert in alerts
+                ]
+
+            if args["preview"]:
+                # Forwards are kept, so the same alerts can be muted after preview
+                self.forwards_stack.setdefault(event.chat_id, [])[:0] = forwards
+                await self.client.send_message(
+                    entity=event.message.chat_id,
+                    reply_to=event.message.id,
+                    message=get_mutes_preview(mutes)
+                )
+                return
+
+            async def mute_alerts(mute_alerts):
+                mute, covered_alerts = mute_alerts
+                mute.createdBy = sender.username
+                silence_id = await self.alertmanager_worker.create_silence(mute)
+                chatbot_logger.info(
+                    "%s alerts muted with silence id - %s",
+                    len(covered_alerts), silence_id
+                )
+                return silence_id
+
+            results = await self.run_silences_operation(mute_alerts, mutes)
 
             await self.client.send_message(
                 entity=event.message.chat_id,
                 reply_to=event.message.id,
-                message=f"Silences created with ids - {silences_ids}"
+                message=get_silences_report(
+                    "Silence created",
+                    [get_alerts_description(covered_alerts) for _, covered_alerts in mutes]
+                        + [description for description, _ in failures],
+                    results + [err for _, err in failures]
+                )
             )
+            await self.show_silences_changes(created_ids=[
+                result for result in results
+                    if not isinstance(result, Exception)
+            ])
 
-        except ForwardFromUnknownChat:
+        except ForwardFromUnknownChat as err:
             chatbot_logger.error(
                 "Chat unknown with id %s",
-                alert.message.forward.chat_id
+                err.chat_id
             )
             await self.client.send_message(
                 entity=event.message.chat_id,
@@ -246,41 +359,49 @@ class ChatBot():
                 or len(self.forwards_stack[event.chat_id]) == 0:
                 raise AlertsNotSpecified()
 
-            silences_ids = []
-            alerts = self.forwards_stack.pop(event.chat_id)
-            for alert in alerts:
-                if alert.message.text != '':
-                    if not alert.message.forward.chat_id in conf.CHATS_IDS:
-                        raise ForwardFromUnknownChat(alert.message.forward.chat_id)
-
-                    alert_cache_keys = self.cache.get_keys_by_entity_messageids(
-                        entity=alert.message.forward.chat_id,
-                        messsages_ids=[alert.message.forward.channel_post]
-                    )
-                    alert_cache_key = alert_cache_keys[0]
-                    alert = self.cache.get_cache_by_key(alert_cache_key)
-                    alert = alert.get('alert')
-                    silences_id = await self.alertmanager_worker.unmute_alert(alert)
-                    silences_ids.append(silences_id)
-
-                    chatbot_logger.info(
-                        "Alert unmuted with silence id - %s",
-                        silences_id
-                    )
+            alerts, failures = self.get_forwarded_alerts(self.forwards_stack.pop(event.chat_id))
 
-            await self.client.send_message(
-                entity=event.message.chat_id,
-                reply_to=event.message.id,
-                message=f"Silences deleted with ids - {silences_ids}"
+            # Several alerts may be muted by one silence,
+            # so every silence is deleted once and result is shared by its alerts
+            silences_ids = await self.run_silences_operation(
+                self.alertmanager_worker.get_alert_silence_id, alerts
             )
+            unique_ids = list(dict.fromkeys(
+                silence_id for silence_id in silences_ids
+                    if not isinstance(silence_id, Exception)
+            ))
+
+            async def delete_silence(silence_id):
+                await self.alertmanager_worker.delete_silence(silence_id)
+                chatbot_logger.info(
+                    "Alert unmuted with silence id - %s",
+                    silence_id
+                )
+                return silence_id
+
+            deleted = dict(zip(
+                unique_ids,
+                await self.run_silences_operation(delete_silence, unique_ids)
+            ))
+            results = [
+                silence_id if isinstance(silence_id, Exception) else deleted[silence_id]
+                for silence_id in silences_ids
+            ]
 
-        except AlertHasntSilence:
-            chatbot_logger.error("Alert not muted")
             await self.client.send_message(
                 entity=event.message.chat_id,
-                reply_to=alert.message.id,
-                message="The alert silence is not removed because the alert is not muted yet."
+                reply_to=event.message.id,
+                message=get_silences_report(
+                    "Silence deleted",
+                    [get_alerts_description([alert]) for alert in alerts]
+                        + [description for description, _ in failures],
+                    results + [err for _, err in failures]
+                )
             )
+            await self.show_silences_changes(deleted_ids=[
+                result for result in deleted.values()
+                    if not isinstance(result, Exception)
+            ])
 
         except Exception as err:
             chatbot_logger.error("Silence delete failed with error: \n%s", err)
@@ -378,6 +499,64 @@ class ChatBot():
             )
 
 
+def get_alerts_description(alerts: list) -> str:
+    """
+    Get short description of alerts for reply messages
+    args:
+        alerts: cached alerts
+    """
+    if len(alerts) == 1:
+        return alerts[0].labels.get("alertname", alerts[0].fingerprint)
+
+    names = sorted({alert.labels.get("alertname", alert.fingerprint) for alert in alerts})
+    return f"{len(alerts)} alerts ({', '.join(names)})"
+
+
+def get_silences_report(operation: str, descriptions: list, results: list) -> str:
+    """
+    Get reply message with result of silences operation for every item
+    args:
+        operation: description of successful operation
+        descriptions: descriptions of alerts of every item
+        results: silence id or exception for every item
+    """
+    succeeded = 0
+    lines = []
+    for description, result in zip(descriptions, results):
+        if isinstance(result, AlertHasntSilence):
+            chatbot_logger.error("Alert %s not muted", description)
+            lines.append(f"{description} - failed, the alert is not muted yet")
+
+        elif isinstance(result, Exception):
+            chatbot_logger.error("Silence operation for %s failed with error: \n%s", description, result)
+            lines.append(f"{description} - failed with error: {str(result).strip()}")
+
+        else:
+            succeeded += 1
+            lines.append(f"{description} - {operation.lower()} with id {result}")
+
+    header = f"{operation} for {succeeded} of {len(descriptions)}"
+    return "\n".join([header, ""] + lines)
+
+
+def get_mutes_preview(mutes: list) -> str:
+    """
+    Get reply message with silences that will be created and alerts covered by them
+    args:
+        mutes: tuples with Mute and alerts covered by it
+    """
+    alerts_count = sum(len(covered_alerts) for _, covered_alerts in mutes)
+    lines = [f"{len(mutes)} silences will be created for {alerts_count} alerts", ""]
+    for number, (mute, covered_alerts) in enumerate(mutes, start=1):
+        matchers = ", ".join(
+            f'{matcher.name}{"=~" if matcher.isRegex else "="}"{matcher.value}"'
+            for matcher in mute.matchers
+        )
+        lines.append(f"{number}. {len(covered_alerts)} alerts - {{{matchers}}}")
+
+    return "\n".join(lines)
+
+
 # Module Exceptions
 
 
@@ -419,3 +598,21 @@ class ForwardFromUnknownChat(Exception):
                 Chat unknown with id {self.chat_id}
             """)
         )
+
+
+class AlertNotCached(Exception):
+    """
+    Exception for cases when forwarded message has no cached alert,
+    usually because alert was resolved and its message deleted
+    args:
+        chat_id: chat of forwarded message
+        message_id: id of forwarded message
+    """
+    def __init__(self, chat_id: int, message_id: int):
+        self.chat_id = chat_id
+        self.message_id = message_id
+        super().__init__(
+            dedent(f"""
+                Alert of message {self.message_id} in chat {self.chat_id} is not active anymore
+            """)
+        )
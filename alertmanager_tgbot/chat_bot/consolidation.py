@@ -0,0 +1,128 @@
+"""Consolidation of alerts into minimal number of silences"""
+
+from data_models import MuteMatcher, BaseAlert
+
+
+# Symbols with special meaning in RE2 syntax used by alertmanager
+RE2_SPECIAL_SYMBOLS = set("\\.+*?()|[]{}^$")
+
+
+def escape_regex(value: str) -> str:
+    """
+    Escape label value for alertmanager regex matcher.
+    Only RE2 special symbols are escaped, because RE2 rejects
+    escaped letters, digits and spaces that python re.escape may produce
+    args:
+        value: label value
+    """
+    return "".join(
+        "\\" + symbol if symbol in RE2_SPECIAL_SYMBOLS else symbol
+        for symbol in value
+    )
+
+
+def get_mute_labels(alert: BaseAlert) -> dict:
+    """
+    Get alert labels that are used in silences matchers
+    args:
+        alert: alert that requires mute
+    """
+    return {
+        name: value
+        for name, value in alert.labels.items()
+            if "pane-" not in name
+    }
+
+
+def get_buckets(labels: list, names: frozenset, varying_name: str = None) -> dict:
+    """
+    Split labels sets into buckets with equal values of all labels except varying one
+    args:
+        labels: labels sets with the same labels names
+        names: labels names
+        varying_name: label that may have different values in bucket
+    """
+    buckets = {}
+    for alert_labels in labels:
+        key = tuple(
+            (name, alert_labels[name])
+            for name in sorted(names)
+                if name != varying_name
+        )
+        buckets.setdefault(key, []).append(alert_labels)
+    return buckets
+
+
+def get_matchers(labels: list, names: frozenset, varying_name: str = None) -> list:
+    """
+    Get silence matchers for labels sets that differ only in varying label
+    args:
+        labels: labels sets with the same labels names
+        names: labels names
+        varying_name: label that may have different values
+    """
+    matchers = [
+        MuteMatcher(name=name, value=labels[0][name], isRegex=False)
+        for name in sorted(names)
+            if name != varying_name
+    ]
+    if varying_name is not None:
+        values = sorted({alert_labels[varying_name] for alert_labels in labels})
+        matchers.append(MuteMatcher(
+            name=varying_name,
+            value="|".join(escape_regex(value) for value in values),
+            isRegex=True
+        ))
+    return matchers
+
+
+def consolidate_alerts(alerts: list) -> list:
+    """
+    Merge alerts into minimal number of silences.
+    Alerts are grouped by set of their labels names. In every group the largest
+    bucket of alerts that differ only in one label is merged into one silence
+    with exact matchers on equal labels and regex alternation on differing one,
+    until only alerts that can't be merged are left.
+    Silence matches exactly the same alerts as separate silences of bucket alerts.
+    Result is list of tuples with silence matchers and alerts covered by it
+    args:
+        alerts: alerts that require mute
+    """
+    groups = {}
+    for alert in alerts:
+        labels = get_mute_labels(alert)
+        groups.setdefault(frozenset(labels), []).append((labels, alert))
+
+    result = []
+    for names, group in groups.items():
+        remaining = []
+        for alert_labels, _ in group:
+            if alert_labels not in remaining:
+                remaining.append(alert_labels)
+
+        buckets = []
+        while remaining:
+            varying_name, bucket = None, remaining[:1]
+            for name in sorted(names):
+                for name_bucket in get_buckets(remaining, names, name).values():
+                    if len(name_bucket) > len(bucket):
+                        varying_name, bucket = name, name_bucket
+
+            if varying_name is None:
+                buckets += [(None, [alert_labels]) for alert_labels in remaining]
+                break
+
+            buckets.append((varying_name, bucket))
+            remaining = [
+                alert_labels for alert_labels in remaining
+                    if alert_labels not in bucket
+            ]
+
+        for varying_name, bucket in buckets:
+            bucket_alerts = [
+                alert for alert_labels, alert in group
+                    if alert_labels in bucket
+            ]
+            result.append((get_matchers(bucket, names, varying_name), bucket_alerts))
+
+    return result
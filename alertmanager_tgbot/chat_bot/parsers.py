@@ -6,6 +6,7 @@ from textwrap import dedent
 import dateparser
 
 from data_models import Mute, MuteMatcher, BaseAlert
+from chat_bot.consolidation import consolidate_alerts
 
 
 silence_parser = argparse.ArgumentParser(
@@ -115,13 +116,22 @@ mute_parser.add_argument("-c", "--comment",
   help="comment for mute"
 )
 
+mute_parser.add_argument("-g", "--group",
+  action="store_true",
+  help="merge alerts into minimal number of silences"
+)
 
-def parse_mute_command(command: str, alert: BaseAlert) -> Mute:
+mute_parser.add_argument("-p", "--preview",
+  action="store_true",
+  help="show silences and number of alerts covered by them without creating"
+)
+
+
+def parse_mute_arguments(command: str) -> dict:
     """
-    Parse mute command into Mute data model
+    Parse mute command arguments
     args:
         command: mute alert command
-        alert: alert that requires mute
     """
     args, unknown = mute_parser.parse_known_args(shlex.split(command))
 
@@ -144,6 +154,40 @@ def parse_mute_command(command: str, alert: BaseAlert) -> Mute:
             }
         ).isoformat()
 
+    return args
+
+
+def get_mute(args: dict, matchers: list) -> Mute:
+    """
+    Get Mute data model for parsed mute command arguments
+    args:
+        args: parsed mute command arguments
+        matchers: silence matchers
+    """
+    if args["ends_at"] != "":
+        return Mute(
+            matchers=matchers,
+            createdBy='',
+            comment=args["comment"],
+            endsAt=args["ends_at"]
+        )
+
+    return Mute(
+        matchers=matchers,
+        createdBy='',
+        comment=args["comment"],
+    )
+
+
+def parse_mute_command(command: str, alert: BaseAlert) -> Mute:
+    """
+    Parse mute command into Mute data model
+    args:
+        command: mute alert command
+        alert: alert that requires mute
+    """
+    args = parse_mute_arguments(command)
+
     mute_matchers = []
     for label in alert.labels:
         if "pane-" not in label:
@@ -154,21 +198,23 @@ def parse_mute_command(command: str, alert: BaseAlert) -> Mute:
                 )
             )
 
-    if args["ends_at"] != "":
-        result = Mute(
-            matchers=mute_matchers,
-            createdBy='',
-            comment=args["comment"],
-            endsAt=args["ends_at"]
-        )
-    else:
-        result = Mute(
-            matchers=mute_matchers,
-            createdBy='',
-            comment=args["comment"],
-        )
+    return get_mute(args, mute_matchers)
 
-    return result
+
+def parse_grouped_mute_command(command: str, alerts: list) -> list:
+    """
+    Parse mute command into minimal number of Mute data models for alerts.
+    Result is list of tuples with Mute and alerts covered by it
+    args:
+        command: mute alert command
+        alerts: alerts that require mute
+    """
+    args = parse_mute_arguments(command)
+
+    return [
+        (get_mute(args, matchers), covered_alerts)
+        for matchers, covered_alerts in consolidate_alerts(alerts)
+    ]
 
 
 unmute_parser = argparse.ArgumentParser(
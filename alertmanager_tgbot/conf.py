@@ -48,7 +48,12 @@ def init_conf():
         chats_ids = None
 
     # Services communication
-    alertmanager_address = getenv("ALERTMANAGER_ADDRESS")
+    alertmanager_addresses = [
+        address.strip()
+        for address in (getenv("ALERTMANAGER_ADDRESS") or "").split(",")
+            if address.strip()
+    ]
+    alertmanager_address = alertmanager_addresses[0] if alertmanager_addresses else None
     grafana_address = getenv("GRAFANA_ADDRESS")
     grafana_auth_token = getenv("GRAFANA_AUTH_TOKEN")
 
@@ -59,6 +64,44 @@ def init_conf():
     alert_template = confs.get("ALERT_TEMPLATE")
     resolve_template = confs.get("ALERT_TEMPLATE")
 
+    # Http connections pool
+    http_pool_limit = confs.get("HTTP_POOL_LIMIT")
+    http_pool_limit_per_host = confs.get("HTTP_POOL_LIMIT_PER_HOST")
+    http_dns_cache_ttl = confs.get("HTTP_DNS_CACHE_TTL")
+    http_keepalive_timeout = confs.get("HTTP_KEEPALIVE_TIMEOUT")
+
+    # Alerts enrichment
+    silences_enrichment = confs.get("SILENCES_ENRICHMENT")
+    silences_refresh_interval = confs.get("SILENCES_REFRESH_INTERVAL")
+    silence_concurrency = confs.get("SILENCE_CONCURRENCY")
+
+    # Telegram rate limits
+    chat_rate_limit = confs.get("CHAT_RATE_LIMIT")
+    chat_rate_burst = confs.get("CHAT_RATE_BURST")
+    global_rate_limit = confs.get("GLOBAL_RATE_LIMIT")
+    global_rate_burst = confs.get("GLOBAL_RATE_BURST")
+
+    # Chanels audit
+    channel_audit_interval = confs.get("CHANNEL_AUDIT_INTERVAL")
+    alerts_full_sync_interval = confs.get("ALERTS_FULL_SYNC_INTERVAL")
+
+    # Alertmanager polling
+    poll_min_interval = confs.get("POLL_MIN_INTERVAL")
+    poll_max_interval = confs.get("POLL_MAX_INTERVAL")
+    poll_backoff = confs.get("POLL_BACKOFF")
+
+    # Incoming alerts
+    webhook_queue_size = confs.get("WEBHOOK_QUEUE_SIZE")
+    alerts_query = confs.get("ALERTS_QUERY")
+    alerts_streaming = confs.get("ALERTS_STREAMING")
+
+    # Persistent cache
+    cache_path = confs.get("CACHE_PATH")
+
+    # Alertmanager cluster
+    alertmanager_query_mode = confs.get("ALERTMANAGER_QUERY_MODE")
+    alertmanager_request_timeout = confs.get("ALERTMANAGER_REQUEST_TIMEOUT")
+
     try:
         global conf
         conf.API_ID=api_id
@@ -71,11 +114,34 @@ def init_conf():
         conf.DEFAULT_CHATS=default_chats
         conf.CHATS_IDS=chats_ids
         conf.ALERTMANAGER_ADDRESS=alertmanager_address
+        conf.ALERTMANAGER_ADDRESSES=alertmanager_addresses
         conf.GRAFANA_ADDRESS=grafana_address
         conf.GRAFANA_AUTH_TOKEN=grafana_auth_token
         conf.ACL=acl
         conf.ALERT_TEMPLATE=alert_template
         conf.RESOLVE_TEMPLATE=resolve_template
+        conf.HTTP_POOL_LIMIT=http_pool_limit
+        conf.HTTP_POOL_LIMIT_PER_HOST=http_pool_limit_per_host
+        conf.HTTP_DNS_CACHE_TTL=http_dns_cache_ttl
+        conf.HTTP_KEEPALIVE_TIMEOUT=http_keepalive_timeout
+        conf.SILENCES_ENRICHMENT=silences_enrichment
+        conf.SILENCES_REFRESH_INTERVAL=silences_refresh_interval
+        conf.SILENCE_CONCURRENCY=silence_concurrency
+        conf.CHAT_RATE_LIMIT=chat_rate_limit
+        conf.CHAT_RATE_BURST=chat_rate_burst
+        conf.GLOBAL_RATE_LIMIT=global_rate_limit
+        conf.GLOBAL_RATE_BURST=global_rate_burst
+        conf.CHANNEL_AUDIT_INTERVAL=channel_audit_interval
+        conf.ALERTS_FULL_SYNC_INTERVAL=alerts_full_sync_interval
+        conf.POLL_MIN_INTERVAL=poll_min_interval
+        conf.POLL_MAX_INTERVAL=poll_max_interval
+        conf.POLL_BACKOFF=poll_backoff
+        conf.WEBHOOK_QUEUE_SIZE=webhook_queue_size
+        conf.ALERTS_QUERY=alerts_query
+        conf.ALERTS_STREAMING=alerts_streaming
+        conf.CACHE_PATH=cache_path
+        conf.ALERTMANAGER_QUERY_MODE=alertmanager_query_mode
+        conf.ALERTMANAGER_REQUEST_TIMEOUT=alertmanager_request_timeout
 
     except ValidationError as err:
         err_type = err.errors()[0].get("type")
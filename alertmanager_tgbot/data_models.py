@@ -8,7 +8,8 @@ from pydantic import (
     BaseModel,
     ValidationInfo,
     field_validator,
-    AnyUrl
+    AnyUrl,
+    Field
 )
 
 
@@ -17,6 +18,16 @@ class ConfFileChat(BaseModel):
     id: int
     default: bool = None
     labels: Dict[str, str] = {}
+    rate_limit: Optional[float] = Field(None, gt=0)
+    rate_burst: Optional[int] = None
+
+
+class ConfFileAlertsQuery(BaseModel):
+    """Query parameters for requesting active alerts from alertmanager api"""
+    silenced: bool = True
+    inhibited: bool = False
+    receiver: Optional[str] = None
+    filter: List[str] = []
 
 
 class ConfFile(BaseModel):
@@ -50,6 +61,52 @@ class ConfFile(BaseModel):
         """
     )
 
+    # Pooled http sessions for alertmanager and grafana
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 10
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_KEEPALIVE_TIMEOUT: int = 30
+
+    # Request all silences once per cycle or every silence separately
+    SILENCES_ENRICHMENT: Literal["bulk", "per_alert"] = "bulk"
+    SILENCES_REFRESH_INTERVAL: float = 60
+
+    # Max number of simultaneous requests to alertmanager by /mute and /unmute commands
+    SILENCE_CONCURRENCY: int = Field(10, gt=0)
+
+    # Telegram messages rate limits in messages per minute, rates must be positive
+    CHAT_RATE_LIMIT: float = Field(20, gt=0)
+    CHAT_RATE_BURST: int = 3
+    GLOBAL_RATE_LIMIT: float = Field(1800, gt=0)
+    GLOBAL_RATE_BURST: int = 30
+
+    # Sleep time in seconds between full audits of chanels history
+    CHANNEL_AUDIT_INTERVAL: int = 3600
+
+    # Sleep time in seconds between syncs of all alerts instead of changed ones
+    ALERTS_FULL_SYNC_INTERVAL: int = 300
+
+    # Adaptive sleep time in seconds between requests to alertmanager
+    POLL_MIN_INTERVAL: float = Field(2, gt=0)
+    POLL_MAX_INTERVAL: float = Field(30, gt=0)
+    POLL_BACKOFF: float = Field(1.5, ge=1)
+
+    # Max number of alerts groups waiting for processing after /alert webhook
+    WEBHOOK_QUEUE_SIZE: int = 1000
+
+    # Filters applied by alertmanager to requested active alerts
+    ALERTS_QUERY: ConfFileAlertsQuery = ConfFileAlertsQuery()
+
+    # Parse active alerts one by one while alertmanager response is read
+    ALERTS_STREAMING: bool = False
+
+    # Database file of persistent cache of sent alerts
+    CACHE_PATH: str = "conf/cache.db"
+
+    # Requests to alertmanager cluster with several instances
+    ALERTMANAGER_QUERY_MODE: Literal["first", "merge"] = "first"
+    ALERTMANAGER_REQUEST_TIMEOUT: float = 30
+
     class Config:
         """Model configuration"""
         validate_assignment = True
@@ -87,6 +144,7 @@ class Conf(ConfFile):
     DEFAULT_CHATS: List[int] = []
     CHATS_IDS: List[int] = []
     ALERTMANAGER_ADDRESS: AnyUrl = None
+    ALERTMANAGER_ADDRESSES: List[AnyUrl] = []
     GRAFANA_ADDRESS: AnyUrl = None
     GRAFANA_AUTH_TOKEN: str = None
 
@@ -137,6 +195,11 @@ class Conf(ConfFile):
         """Convert pydantic url type to str"""
         return str(v)
 
+    @field_validator('ALERTMANAGER_ADDRESSES')
+    def list_tostr(cls, v: list) -> list:
+        """Convert list of pydantic url types to list of str"""
+        return [str(url) for url in v]
+
 
 class BaseAlert(BaseModel):
     """Base model for alerts"""
@@ -235,3 +298,18 @@ class EnrichedActiveAlert(ActiveAlert):
 class EnrichedActiveAlerts(BaseModel):
     """List of active alerts enriched with information by alertmanager workers"""
     alerts: List[EnrichedActiveAlert]
+
+
+class AlertsDelta(BaseModel):
+    """Difference between two snapshots of active alerts"""
+    added: List[EnrichedActiveAlert] = []
+    changed: List[EnrichedActiveAlert] = []
+
+    # Previous versions of removed and changed alerts
+    removed: List[EnrichedActiveAlert] = []
+
+    def is_empty(self) -> bool:
+        """Check that snapshots are equal"""
+        return len(self.added) == 0 \
+            and len(self.changed) == 0 \
+            and len(self.removed) == 0
@@ -4,6 +4,7 @@ from os import remove, listdir
 from asyncio import sleep
 from uuid import uuid4
 from textwrap import dedent
+from aiohttp import ClientSession
 from request_senders import send_get_image_request, WrongResponseCode
 from grafana_workers.logger import grafana_workers_logger
 
@@ -14,15 +15,18 @@ class GrafanaWorker():
     args:
         grafana_url: url to Grafana service
         grafana_auth_token: service authorization token
+        session: pooled http session for requests to Grafana
     """
     def __init__(
             self,
             grafana_url: str,
-            grafana_auth_token: str
+            grafana_auth_token: str,
+            session: ClientSession = None
         ) -> None:
 
         self.grafana_url = grafana_url
         self.grafana_auth_token = grafana_auth_token
+        self.session = session
         self.grafana_renderer_url = self.grafana_url + "renderer"
 
 
@@ -47,7 +51,8 @@ class GrafanaWorker():
                 await send_get_image_request(
                     output_file_name = image_file_name,
                     url = pane_url,
-                    authorization_header={"Authorization": f"Bearer {self.grafana_auth_token}"}
+                    authorization_header={"Authorization": f"Bearer {self.grafana_auth_token}"},
+                    session=self.session
                 )
                 panel_rendered = True
 
@@ -0,0 +1,140 @@
+"""Incremental splitting of JSON arrays into items"""
+
+import re
+
+
+# Bytes that change scanner state outside and inside of JSON strings
+STRUCTURAL_BYTES = re.compile(rb'[\[\]{},"]')
+STRING_BYTES = re.compile(rb'["\\]')
+
+
+class JSONArraySplitter():
+    """
+    Incremental scanner of top-level JSON array.
+    Chunks of array are fed as they arrive and raw bytes of every complete item
+    are returned, so only one item is kept in memory at a time.
+    Items are not parsed, they are expected to be validated by data models
+    """
+    def __init__(self) -> None:
+        self.buffer = b""
+        self.position = 0
+        self.item_start = 0
+        self.depth = 0
+        self.in_string = False
+        self.finished = False
+
+
+    def _take_item(self, item_end: int) -> bytes:
+        """
+        Cut item from buffer and move start of next item after delimiter
+        args:
+            item_end: position of delimiter that ends item
+        """
+        item = self.buffer[self.item_start:item_end].strip()
+        self.item_start = item_end + 1
+        return item
+
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        Scan next chunk of array and return items completed by it
+        args:
+            chunk: next part of response body
+        """
+        if self.finished:
+            if chunk.strip():
+                raise JSONArrayMalformed("Data after end of array")
+            return []
+
+        self.buffer += chunk
+        items = []
+        while True:
+            if self.in_string:
+                match = STRING_BYTES.search(self.buffer, self.position)
+                if match is None:
+                    self.position = len(self.buffer)
+                    break
+
+                if match.group() == b"\\":
+                    # Escaped byte may be in the next chunk
+                    if match.end() >= len(self.buffer):
+                        self.position = match.start()
+                        break
+                    self.position = match.end() + 1
+                    continue
+
+                self.in_string = False
+                self.position = match.end()
+                continue
+
+            match = STRUCTURAL_BYTES.search(self.buffer, self.position)
+            if match is None:
+                self.position = len(self.buffer)
+                break
+
+            symbol = match.group()
+            self.position = match.end()
+            if self.depth == 0 and symbol != b"[":
+                raise JSONArrayMalformed("Response body is not array")
+
+            if symbol == b'"':
+                self.in_string = True
+
+            elif symbol in (b"[", b"{"):
+                if self.depth == 0:
+                    self.item_start = self.position
+                self.depth += 1
+
+            elif symbol in (b"]", b"}"):
+                self.depth -= 1
+                if self.depth == 0:
+                    item = self._take_item(match.start())
+                    if item:
+                        items.append(item)
+                    self.finished = True
+                    if self.buffer[self.position:].strip():
+                        raise JSONArrayMalformed("Data after end of array")
+                    break
+
+            elif self.depth == 1:
+                item = self._take_item(match.start())
+                if not item:
+                    raise JSONArrayMalformed("Empty array item")
+                items.append(item)
+
+        # Drop scanned bytes of already returned items
+        if self.depth > 0 and self.item_start > 0:
+            self.buffer = self.buffer[self.item_start:]
+            self.position -= self.item_start
+            self.item_start = 0
+        elif self.depth == 0 and not self.finished:
+            if self.buffer.strip():
+                raise JSONArrayMalformed("Response body is not array")
+            self.buffer = b""
+            self.position = 0
+
+        return items
+
+
+    def close(self) -> None:
+        """
+        Check that whole array was scanned
+        """
+        if not self.finished:
+            raise JSONArrayMalformed("Array is not complete")
+
+
+# Module Exceptions
+
+
+class JSONArrayMalformed(Exception):
+    """
+    Exception for cases when streamed body is not valid JSON array
+    args:
+        reason: what is wrong with body
+    """
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(
+            f"Malformed JSON array. Reason is - {self.reason}"
+        )
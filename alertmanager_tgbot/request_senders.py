@@ -2,28 +2,79 @@
 
 import asyncio
 import json
+from contextlib import asynccontextmanager
 from textwrap import dedent
+from typing import AsyncIterator
 import aiohttp
 import aiofiles
 
 from project_logging import root_logger
+from json_streams import JSONArraySplitter, JSONArrayMalformed
 
 
-async def send_post_request(url: str, message: dict, ignored_statuses: list = []) -> dict:
+# Size of response body chunks read by streaming requests
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def create_session(
+        limit: int = 100,
+        limit_per_host: int = 10,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: int = 30
+    ) -> aiohttp.ClientSession:
+    """
+    Create long-lived client session with pooled keep-alive connections.
+    One session is expected per upstream service and must be closed on shutdown
+    args:
+        limit: total number of simultaneous connections in pool
+        limit_per_host: number of simultaneous connections to one host
+        dns_cache_ttl: seconds to keep resolved addresses in DNS cache
+        keepalive_timeout: seconds to keep idle connection open for reuse
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        use_dns_cache=True,
+        ttl_dns_cache=dns_cache_ttl,
+        keepalive_timeout=keepalive_timeout
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+@asynccontextmanager
+async def session_scope(session: aiohttp.ClientSession = None):
+    """
+    Yield provided session or temporary one if session is not provided
+    args:
+        session: long-lived session created by create_session
+    """
+    if session is not None:
+        yield session
+
+    else:
+        async with aiohttp.ClientSession() as temporary_session:
+            yield temporary_session
+
+
+async def send_post_request(
+        url: str,
+        message: dict,
+        ignored_statuses: list = [],
+        session: aiohttp.ClientSession = None
+    ) -> dict:
     """
     Send POST request
     args:
        url: URL where the request will be sent
        message: request body
        ignored_statuses: response codes thats will be ignored
+       session: pooled session, temporary one will be used if not provided
     """
-    async with aiohttp.ClientSession() as session:
+    async with session_scope(session) as session:
         try:
             async with await session.post(url=url, json=message, timeout=600000) as response:
                 response_status = response.status
                 response_text = await response.text()
-                response.close()
-                await session.close()
 
                 if response_status != 200 and response_status not in ignored_statuses:
                     root_logger.error(f"""
@@ -45,20 +96,25 @@ async def send_post_request(url: str, message: dict, ignored_statuses: list = []
         raise WrongResponseBodyFromat(url, response_text) from err
 
 
-async def send_get_request(url: str, ignored_statuses: list =[]) -> dict:
+async def send_get_request(
+        url: str,
+        ignored_statuses: list =[],
+        session: aiohttp.ClientSession = None,
+        params: list = None
+    ) -> dict:
     """
     Send GET request
     args:
        url: URL where the request will be sent
        ignored_statuses: response codes thats will be ignored
+       session: pooled session, temporary one will be used if not provided
+       params: query parameters as list of name and value pairs
     """
-    async with aiohttp.ClientSession() as session:
+    async with session_scope(session) as session:
         try:
-            async with await session.get(url=url, timeout=600000) as response:
+            async with await session.get(url=url, params=params, timeout=600000) as response:
                 response_status = response.status
                 response_text = await response.text()
-                response.close()
-                await session.close()
 
                 if response_status != 200 and response_status not in ignored_statuses:
                     root_logger.error(f"""
@@ -80,11 +136,90 @@ async def send_get_request(url: str, ignored_statuses: list =[]) -> dict:
         raise WrongResponseBodyFromat(url, response_text) from err
 
 
+async def send_get_bytes_request(
+        url: str,
+        ignored_statuses: list =[],
+        session: aiohttp.ClientSession = None,
+        params: list = None
+    ) -> bytes:
+    """
+    Send GET request and return raw response body, so it can be parsed
+    straight into data models without decoding and json.loads
+    args:
+       url: URL where the request will be sent
+       ignored_statuses: response codes thats will be ignored
+       session: pooled session, temporary one will be used if not provided
+       params: query parameters as list of name and value pairs
+    """
+    async with session_scope(session) as session:
+        try:
+            async with await session.get(url=url, params=params, timeout=600000) as response:
+                response_status = response.status
+                response_body = await response.read()
+
+                if response_status != 200 and response_status not in ignored_statuses:
+                    root_logger.error(f"""
+                                        failed send get request to - {url};
+                                        status - {response_status};
+                                        detail - {response_body}
+                                        """)
+                    raise WrongResponseCode(url, response_status, response_body)
+
+        except asyncio.TimeoutError as err:
+            root_logger.exception(f"Get request time out for url - {url}")
+            raise RequestTimeout(url) from err
+
+    return response_body
+
+
+async def send_get_stream_request(
+        url: str,
+        session: aiohttp.ClientSession = None,
+        params: list = None
+    ) -> AsyncIterator[bytes]:
+    """
+    Send GET request for JSON array and yield raw bytes of its items
+    as soon as they are read, so whole response body is never kept in memory
+    args:
+       url: URL where the request will be sent
+       session: pooled session, temporary one will be used if not provided
+       params: query parameters as list of name and value pairs
+    """
+    async with session_scope(session) as session:
+        try:
+            async with await session.get(url=url, params=params, timeout=600000) as response:
+                response_status = response.status
+                if response_status != 200:
+                    response_text = await response.text()
+                    root_logger.error(f"""
+                                        failed send get request to - {url};
+                                        status - {response_status};
+                                        detail - {response_text}
+                                        """)
+                    raise WrongResponseCode(url, response_status, response_text)
+
+                splitter = JSONArraySplitter()
+                try:
+                    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                        for item in splitter.feed(chunk):
+                            yield item
+                    splitter.close()
+
+                except JSONArrayMalformed as err:
+                    root_logger.warning(f"Streamed response is not JSON array - {err.reason}")
+                    raise WrongResponseBodyFromat(url, err.reason) from err
+
+        except asyncio.TimeoutError as err:
+            root_logger.exception(f"Get request time out for url - {url}")
+            raise RequestTimeout(url) from err
+
+
 async def send_get_image_request(
         url: str,
         output_file_name: str,
         ignored_statuses: list =[],
-        authorization_header: dict = None
+        authorization_header: dict = None,
+        session: aiohttp.ClientSession = None
     ) -> None:
     """
     Send GET request and save response image
@@ -92,8 +227,9 @@ async def send_get_image_request(
        url: URL where the request will be sent
        ignored_statuses: response codes thats will be ignored
        output_file_name: filename where respose will be stored
+       session: pooled session, temporary one will be used if not provided
     """
-    async with aiohttp.ClientSession() as session:
+    async with session_scope(session) as session:
         try:
             session_timeout = aiohttp.ClientTimeout(total=None,sock_connect=600000,sock_read=600000)
             async with await session.get(url=url, timeout=session_timeout, headers=authorization_header) as response:
@@ -112,28 +248,29 @@ async def send_get_image_request(
                 image_file = await aiofiles.open(output_file_name, mode='wb')
                 await image_file.write(await response.read())
                 await image_file.close()
-                response.close()
-                await session.close()
 
         except asyncio.TimeoutError as err:
             root_logger.exception(f"Get request time out for url - {url}")
             raise RequestTimeout(url) from err
 
 
-async def send_delete_request(url: str, ignored_statuses: list =[]) -> None:
+async def send_delete_request(
+        url: str,
+        ignored_statuses: list =[],
+        session: aiohttp.ClientSession = None
+    ) -> None:
     """
     Send DELETE request
     args:
        url: URL where the request will be sent
        ignored_statuses: response codes thats will be ignored
+       session: pooled session, temporary one will be used if not provided
     """
-    async with aiohttp.ClientSession() as session:
+    async with session_scope(session) as session:
         try:
             async with await session.delete(url=url, timeout=600000) as response:
                 response_status = response.status
                 response_text = await response.text()
-                response.close()
-                await session.close()
 
                 if response_status != 200 and response_status not in ignored_statuses:
                     root_logger.error(f"""
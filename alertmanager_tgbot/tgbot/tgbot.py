@@ -8,6 +8,7 @@ from grafana_workers import GrafanaWorker
 from chanel_workers import ChanelWorker
 from chat_bot import ChatBot
 from cache import Cache
+from cache_storage import CacheStorage
 
 
 class TGBot(ChanelWorker, ChatBot):
@@ -19,6 +20,8 @@ class TGBot(ChanelWorker, ChatBot):
         phone_number: phone number of telegram user account
         user_password: password of telegram user account
         client_name: name of telegram session
+        cache_storage: persistent storage of sent alerts cache,
+            cache is kept only in RAM if not provided
     """
     def __init__(
             self,
@@ -29,11 +32,12 @@ class TGBot(ChanelWorker, ChatBot):
             alertmanager_worker: AlertmanagerWorker,
             grafana_worker: GrafanaWorker,
             client_name="tgbot",
-            loop=new_event_loop()
+            loop=new_event_loop(),
+            cache_storage: CacheStorage = None
         ) -> None:
 
         self.loop = loop
-        self.cache = Cache()
+        self.cache = Cache(storage=cache_storage)
         self.phone_number = phone_number
         self.user_password = user_password
         self.client = TelegramClient(
@@ -55,7 +59,8 @@ class TGBot(ChanelWorker, ChatBot):
             client=self.client,
             cache=self.cache,
             grafana_worker=grafana_worker,
-            alertmanager_worker=alertmanager_worker
+            alertmanager_worker=alertmanager_worker,
+            chanel_worker=self
         )
 
 
@@ -0,0 +1,90 @@
+"""
+Benchmark of alert message render cost.
+Compares compiling template on every render, as formatters did before,
+with compiled templates from templates registry.
+Run from repository root: python3 benchmarks/render_templates.py
+"""
+
+import sys
+from os import path
+from timeit import repeat
+
+sys.path.insert(0, path.join(path.dirname(path.dirname(path.abspath(__file__))), "alertmanager_tgbot"))
+
+from jinja2 import Template, StrictUndefined
+from jinja2.filters import FILTERS
+
+from data_models import ConfFile, EnrichedActiveAlert
+from chanel_workers.formatters import format_date, templates_registry
+
+
+NUMBER = 1000
+REPEAT = 5
+
+ALERT = EnrichedActiveAlert(
+    annotations={"summary": "Disk usage is above 90%"},
+    labels={
+        "alertname": "DiskUsageHigh",
+        "dns_hostname": "db-01.example.com",
+        "severity": "critical",
+        "env": "production"
+    },
+    endsAt="2030-01-01T00:00:00Z",
+    startsAt="2024-01-01T12:30:45.123456789Z",
+    fingerprint="0123456789abcdef",
+    generatorURL="http://prometheus.example.com/graph",
+    receivers=[{"name": "telegram"}],
+    updatedAt="2024-01-01T12:30:45Z",
+    status={"inhibitedBy": [], "silencedBy": [], "state": "active"}
+)
+
+
+def render_compiled_every_time(source: str, alert: EnrichedActiveAlert) -> str:
+    """
+    Render alert like formatters did before templates registry
+    args:
+        source: template source
+        alert: rendered alert
+    """
+    return Template(source, undefined=StrictUndefined).render(**alert.dict())
+
+
+def render_from_registry(source: str, alert: EnrichedActiveAlert) -> str:
+    """
+    Render alert with compiled template from templates registry
+    args:
+        source: template source
+        alert: rendered alert
+    """
+    template = templates_registry.get_template("alert", source, strict=True)
+    return template.render(**alert.dict())
+
+
+def measure(render, source: str) -> float:
+    """
+    Get best time of single render in microseconds
+    args:
+        render: render function
+        source: template source
+    """
+    timings = repeat(lambda: render(source, ALERT), number=NUMBER, repeat=REPEAT)
+    return min(timings) / NUMBER * 1e6
+
+
+def main() -> None:
+    """Run benchmark and print results"""
+    # Filter was registered globally before templates registry
+    FILTERS["format_date"] = format_date
+    source = ConfFile().ALERT_TEMPLATE
+
+    assert render_compiled_every_time(source, ALERT) == render_from_registry(source, ALERT)
+
+    before = measure(render_compiled_every_time, source)
+    after = measure(render_from_registry, source)
+    print(f"Template compiled on every render - {before:.1f} us per render")
+    print(f"Template from registry - {after:.1f} us per render")
+    print(f"Speedup - {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()